@@ -0,0 +1,120 @@
+import logging
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from job_posting import JobPosting
+from rate_limit import TokenBucket
+
+logger = logging.getLogger('info_logger')
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class AdzunaError(Exception):
+    """
+    Raised when the Adzuna api keeps failing after the retries.
+    """
+
+
+def parse_result(item):
+    """
+    This function converts an Adzuna search result to a JobPosting.
+    """
+    return JobPosting(item.get('company', {}).get('display_name', ''),
+                      item.get('location', {}).get('display_name', ''),
+                      item['title'].replace("<strong>", "").replace("</strong>", ""),
+                      item['created'].split('T')[0].replace("-", "/"),
+                      source='adzuna')
+
+
+class AdzunaClient:
+    """
+    A client of the Adzuna jobs search api. It keeps its connections alive, fetches the result pages of a search
+    concurrently, stays under a request rate shared by all its searches and retries throttled (429) and failed (5xx)
+    requests with exponential backoff.
+    """
+
+    def __init__(self, url, app_id, app_key, session=None, results_per_page=50, max_pages=5, concurrency=3,
+                 rate_limiter=None, max_retries=4, backoff=1.0, timeout=30):
+        """
+        :param url: the search url, with a {} for the page number.
+        :param session: the requests session to use, a new one by default.
+        :param max_pages: the maximal number of pages fetched per search.
+        :param concurrency: the maximal number of pages fetched at the same time.
+        :param rate_limiter: a TokenBucket every request takes a token from, 1 request per second by default.
+        :param backoff: the seconds waited before the first retry, doubled for every retry.
+        :param timeout: the timeout of a request in seconds.
+        """
+        self.url = url
+        self.app_id = app_id
+        self.app_key = app_key
+        self.session = session or requests.Session()
+        self.results_per_page = results_per_page
+        self.max_pages = max_pages
+        self.concurrency = concurrency
+        self.rate_limiter = rate_limiter or TokenBucket(1)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+
+    def get_page(self, job_name, location, page, sort_by=None):
+        """
+        This function gets one page of search results, retrying throttled and failed requests.
+        :param sort_by: an optional order of the results ("date", "salary" or "relevance").
+        :return: the decoded json response.
+        """
+        params = {'app_id': self.app_id, 'app_key': self.app_key, 'what': job_name, 'where': location,
+                  'results_per_page': self.results_per_page, 'content-type': 'application/json'}
+        if sort_by is not None:
+            params['sort_by'] = sort_by
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            try:
+                response = self.session.get(self.url.format(page), params=params, timeout=self.timeout)
+            except requests.RequestException as error:
+                reason = str(error)
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    response.raise_for_status()
+                    return response.json()
+                reason = "status {}".format(response.status_code)
+                retry_after = response.headers.get('Retry-After')
+                if retry_after and retry_after.isdigit():
+                    time.sleep(int(retry_after))
+                    continue
+            if attempt < self.max_retries:
+                delay = self.backoff * 2 ** attempt
+                logger.info("Adzuna page {} failed ({}), retrying in {}s".format(page, reason, delay))
+                time.sleep(delay)
+        raise AdzunaError("Adzuna page {} failed after {} retries: {}".format(page, self.max_retries, reason))
+
+    def search(self, job_name, location, new_jobs=None):
+        """
+        This function gets the jobs of a search. The first page tells how many results there are, and the rest of
+        the pages (up to max_pages) are then fetched concurrently, concurrency pages at a time.
+        :param new_jobs: an optional callable that gets the jobs of a page and returns the ones not seen in former
+        runs (incremental crawling). The results are then sorted by date, and the search stops at the first page
+        without any new job.
+        :return: a generator of JobPosting, in page order.
+        """
+        sort_by = 'date' if new_jobs is not None else None
+        first_page = self.get_page(job_name, location, 1, sort_by)
+        pages = min(self.max_pages, math.ceil(first_page.get('count', 0) / self.results_per_page))
+        fetched = [first_page['results']]
+        number = 1
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            while fetched:
+                for results in fetched:
+                    jobs = [parse_result(item) for item in results]
+                    if new_jobs is not None:
+                        jobs = new_jobs(jobs)
+                        if not jobs and results:
+                            logger.info("Adzuna page {} holds only known jobs, stopped".format(number))
+                            return
+                    yield from jobs
+                    number += 1
+                numbers = range(number, min(number + self.concurrency, pages + 1))
+                fetched = list(executor.map(lambda page: self.get_page(job_name, location, page, sort_by)['results'],
+                                            numbers))
+        logger.info("retrieved Adzuna web API information successfully ({} pages)".format(max(pages, 1)))
@@ -0,0 +1,72 @@
+import argparse
+import random
+import time
+from job_parsers import PARSERS
+
+CARD = """
+<section class="card-content" data-jobid="{index}">
+  <div class="flex-row">
+    <div class="summary">
+      <header class="card-header"><h2 class="title"><a href="https://job-openings.monster.com/{index}">
+        {title}</a></h2></header>
+      <div class="company"><span class="name">{company}</span></div>
+      <div class="location"><span class="name">
+        {location}</span></div>
+    </div>
+    <div class="meta flex-col"><time datetime="2017-05-26T12:00">{posted}</time>
+      <span class="mux-tooltip applied-only" data-mux="tooltip" title="Applied"><i aria-hidden="true"
+        class="icon icon-applied"></i><span class="sr-only">Applied</span></span></div>
+  </div>
+</section>
+"""
+FILLER = '<div class="ad-container"><script>var ad = {{"slot": {0}, "size": [300, 250]}};</script></div>\n'
+
+
+def synthetic_page(cards, seed=0):
+    """
+    This function builds a search results page with the markup of the Monster job cards, and some unrelated markup
+    around them.
+    """
+    rng = random.Random(seed)
+    parts = ["<html><head><title>Jobs</title>", "".join(FILLER.format(i) for i in range(50)), "</head><body>"]
+    for index in range(cards):
+        parts.append(CARD.format(index=index, title="Data Scientist {}".format(index),
+                                 company="Company {}".format(rng.randint(1, 500)),
+                                 location="Boston, MA {}".format(rng.randint(2000, 2999)),
+                                 posted="Posted today" if rng.random() < 0.2 else "{} days ago".format(
+                                     rng.randint(1, 30))))
+        parts.append(FILLER.format(index))
+    parts.append("</body></html>")
+    return "".join(parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks the job card parsers on saved or synthetic pages.")
+    parser.add_argument('pages', nargs='*', help='saved Monster search pages, a synthetic page is used if none.')
+    parser.add_argument('--cards', type=int, default=250, help='the number of cards of the synthetic page.')
+    parser.add_argument('--repeat', type=int, default=20, help='the number of times each page is parsed.')
+    arguments = parser.parse_args()
+    pages = []
+    for path in arguments.pages:
+        with open(path, encoding='utf-8', errors='replace') as page_file:
+            pages.append((path, page_file.read()))
+    if not pages:
+        pages.append(("synthetic page, {} cards".format(arguments.cards), synthetic_page(arguments.cards)))
+    for parser_name, parse in PARSERS.items():
+        if parse("") != [] or parse(" \n") != []:
+            print("{:<12} doesn't give an empty list for a blank page!".format(parser_name))
+    for name, html in pages:
+        print("{} ({} KB)".format(name, len(html) // 1024))
+        reference = PARSERS['html.parser'](html)
+        for parser_name, parse in PARSERS.items():
+            if parse(html) != reference:
+                print("  {:<12} gives different results than html.parser!".format(parser_name))
+            start = time.perf_counter()
+            for _ in range(arguments.repeat):
+                parse(html)
+            elapsed = (time.perf_counter() - start) / arguments.repeat
+            print("  {:<12}{:>10.2f} ms/page{:>8} jobs".format(parser_name, elapsed * 1000, len(reference)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+import argparse
+import gc
+import time
+import tracemalloc
+from job_posting import JobPosting, intern_field
+
+
+def synthetic_rows(count):
+    """
+    This function yields the fields of count postings. Like parsed pages, every field is a new string object even
+    when its value repeats (companies, locations, titles and dates are drawn from small sets).
+    """
+    for i in range(count):
+        yield ("Company {}".format(i % 5000), "City {}, ST".format(i % 300),
+               "Data Scientist {}".format(i % 50000), "2020-11-{:02d}".format(i % 30 + 1))
+
+
+def measure(build):
+    """
+    This function returns the memory in MB held by the result of build (records and their strings), and the result.
+    """
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    memory = tracemalloc.get_traced_memory()[0] / 1024 ** 2
+    tracemalloc.stop()
+    return memory, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compares the memory and dedupe time of JobPosting and lists, "
+                                                 "with and without interning.")
+    parser.add_argument('--count', type=int, default=1000000, help='the number of synthetic postings.')
+    arguments = parser.parse_args()
+    count = arguments.count
+    # the interned list interns the same fields as JobPosting, comparing it with JobPosting shows what the record type
+    # saves, comparing it with the plain list what interning saves.
+    cases = [
+        ("list [company, location, title, date]", lambda: [list(row) for row in synthetic_rows(count)],
+         lambda job: tuple(job)),
+        ("list, interned like JobPosting", lambda: [[intern_field(company), intern_field(location), title,
+                                                     intern_field(date)]
+                                                    for company, location, title, date in synthetic_rows(count)],
+         lambda job: tuple(job)),
+        ("JobPosting", lambda: [JobPosting(*row, source='monster') for row in synthetic_rows(count)],
+         lambda job: job.key),
+    ]
+    print("{:<40}{:>14}{:>16}{:>14}".format("record type", "memory (MB)", "bytes/record", "dedupe (s)"))
+    for name, build, key in cases:
+        memory, records = measure(build)
+        start = time.perf_counter()
+        seen = set()
+        for record in records:
+            seen.add(key(record))
+        elapsed = time.perf_counter() - start
+        print("{:<40}{:>14.1f}{:>16.1f}{:>14.2f}".format(name, memory, memory * 1024 ** 2 / count, elapsed))
+        del records, seen
+
+
+if __name__ == '__main__':
+    main()
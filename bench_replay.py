@@ -0,0 +1,30 @@
+import argparse
+import cProfile
+import pstats
+import time
+import jobname_cli
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Runs a batch of searches against recorded fixtures (see --record in "
+                                                 "jobname_cli.py), without network or MySQL, and profiles it.")
+    parser.add_argument('fixtures', help='the fixture directory recorded with jobname_cli.py --record.')
+    parser.add_argument('batch', help='the batch file of the searches that were recorded.')
+    parser.add_argument('--profile', type=int, metavar='N', default=0,
+                        help='print the N functions with the most cumulative time (of the parent process only).')
+    parser.add_argument('--workers', type=int, default=1, help='the number of processes running the searches.')
+    arguments = parser.parse_args()
+    profiler = cProfile.Profile() if arguments.profile else None
+    start = time.perf_counter()
+    if profiler is not None:
+        profiler.enable()
+    jobname_cli.run_batch(arguments.batch, replay=arguments.fixtures, workers=arguments.workers)
+    if profiler is not None:
+        profiler.disable()
+    print("replayed in {:.2f}s".format(time.perf_counter() - start))
+    if profiler is not None:
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(arguments.profile)
+
+
+if __name__ == '__main__':
+    main()
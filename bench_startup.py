@@ -0,0 +1,109 @@
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from city_state import load_city_states
+
+# Each measurement runs in a fresh interpreter which reports the time the statement took and its peak resident memory
+# on stderr (the statement may print to stdout).
+MEASURE = """
+import resource, runpy, sys, time
+sys.path.insert(0, {path!r})
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, file=sys.stderr)
+"""
+
+RUN_HELP = """
+sys.argv = ['jobname_cli.py', '--help']
+try:
+    runpy.run_path('jobname_cli.py', run_name='__main__')
+except SystemExit:
+    pass
+"""
+
+# the packages jobname_cli.py imported at the top before they moved into the functions that use them.
+EAGER_IMPORTS = """
+import requests, bs4, lxml.html, mysql.connector, geopy.geocoders, selenium.webdriver
+"""
+
+CASES = [
+    ("python startup only", "pass"),
+    ("dict literal module (previous city_state)", "import legacy_city_state"),
+    ("lazy city_state import", "import city_state"),
+    ("lazy city_state + first lookup", "from location_index import get_location_index\n"
+                                       "get_location_index().is_valid('Boston', 'MA')"),
+    ("jobname_cli.py --help, eager imports (previous)", EAGER_IMPORTS + RUN_HELP),
+    ("jobname_cli.py --help", RUN_HELP),
+]
+
+
+def copy_sources(source, directory):
+    """
+    This function copies the modules, the config and the gazetteer to a directory without cached bytecode, and writes
+    a module that builds the city data as a dict literal at import, like city_state did before the data moved to the
+    gazetteer file.
+    """
+    for name in os.listdir(source):
+        if name.endswith(('.py', '.ini', '.dat')):
+            shutil.copy(os.path.join(source, name), directory)
+    with open(os.path.join(directory, "legacy_city_state.py"), "w") as legacy_file:
+        legacy_file.write("city_to_state_dict = {\n")
+        for city, state in load_city_states():
+            legacy_file.write("    {}: {},\n".format(json.dumps(city), json.dumps(state)))
+        legacy_file.write("}\n")
+
+
+def measure(statement, path, repeat, cold=False):
+    """
+    This function runs a statement in repeat fresh interpreters.
+    :param cold: whether bytecode isn't written, so the modules of path are compiled from source every time while it
+    has no bytecode yet (a first run). By default the bytecode is written and later runs import it.
+    :return: the median time of the statement in ms, the median time of the whole process (starting the interpreter
+    included) in ms and the median peak resident memory in MB.
+    """
+    times, process_times, memories = [], [], []
+    environment = dict(os.environ)
+    if cold:
+        environment["PYTHONDONTWRITEBYTECODE"] = "1"
+    else:
+        environment.pop("PYTHONDONTWRITEBYTECODE", None)
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = subprocess.run([sys.executable, "-c", MEASURE.format(path=path, statement=statement)], cwd=path,
+                                env=environment, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
+        process_times.append((time.perf_counter() - start) * 1000)
+        elapsed, memory = output.stderr.split()[-2:]
+        times.append(float(elapsed) * 1000)
+        memories.append(int(memory) / 1024)
+    return statistics.median(times), statistics.median(process_times), statistics.median(memories)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks the start up time and memory of the city data and of "
+                                                 "jobname_cli.py --help.")
+    parser.add_argument('--repeat', type=int, default=10, help='the number of interpreters per case.')
+    arguments = parser.parse_args()
+    here = os.path.dirname(os.path.abspath(__file__))
+    with tempfile.TemporaryDirectory() as directory:
+        copy_sources(here, directory)
+        # every cold case runs before the first warm run writes the bytecode of the copied modules.
+        cold = [measure(statement, directory, arguments.repeat, cold=True) for _, statement in CASES]
+        warm = []
+        for _, statement in CASES:
+            measure(statement, directory, 1)  # compiles the modules to bytecode, it is not part of the measurements.
+            warm.append(measure(statement, directory, arguments.repeat))
+    print("{:<50}{:>11}{:>11}{:>11}{:>11}{:>11}{:>11}".format("case", "cold (ms)", "process", "RSS (MB)",
+                                                                "warm (ms)", "process", "RSS (MB)"))
+    for (name, _), cold_case, warm_case in zip(CASES, cold, warm):
+        print("{:<50}{:>11.2f}{:>11.2f}{:>11.1f}{:>11.2f}{:>11.2f}{:>11.1f}".format(name, *(cold_case + warm_case)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+import hashlib
+import math
+import os
+import struct
+import threading
+
+MAGIC = b'BLM1'
+HEADER = struct.Struct('<4sQQQ')  # magic, number of bits, number of hashes, number of items added
+
+
+class BloomFilter:
+    """
+    A set of byte strings in a fixed bit array: membership tests can be wrong about an item that was never added
+    (with a probability of about error_rate while no more than capacity items were added), never about one that was.
+    """
+
+    def __init__(self, capacity=1000000, error_rate=0.001, bits=None, hashes=None):
+        """
+        :param capacity: the number of items the filter is sized for.
+        :param error_rate: the false positive probability at capacity items.
+        :param bits: the size of the bit array, computed from capacity and error_rate by default.
+        :param hashes: the number of bits set per item, computed from capacity and error_rate by default.
+        """
+        self.bits = bits or math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hashes = hashes or max(1, round(self.bits / capacity * math.log(2)))
+        self.capacity = capacity
+        self.count = 0
+        self._array = bytearray((self.bits + 7) // 8)
+        self._lock = threading.Lock()
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item, digest_size=16).digest()
+        first, second = struct.unpack('<QQ', digest)
+        return [(first + i * second) % self.bits for i in range(self.hashes)]
+
+    def add(self, item):
+        """
+        This function adds an item (bytes) to the filter.
+        """
+        positions = self._positions(item)
+        with self._lock:
+            for position in positions:
+                self._array[position >> 3] |= 1 << (position & 7)
+            self.count += 1
+
+    def __contains__(self, item):
+        array = self._array
+        return all(array[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def __len__(self):
+        return self.count
+
+    def save(self, path):
+        """
+        This function writes the filter to a file, replacing it atomically so a crash never leaves half a filter.
+        """
+        temporary = path + '.tmp'
+        with self._lock, open(temporary, 'wb') as bloom_file:
+            bloom_file.write(HEADER.pack(MAGIC, self.bits, self.hashes, self.count))
+            bloom_file.write(self._array)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path, capacity=1000000):
+        """
+        This function reads a filter written by save.
+        """
+        with open(path, 'rb') as bloom_file:
+            magic, bits, hashes, count = HEADER.unpack(bloom_file.read(HEADER.size))
+            if magic != MAGIC:
+                raise ValueError("{} is not a bloom filter file".format(path))
+            bloom_filter = cls(capacity, bits=bits, hashes=hashes)
+            bloom_filter._array = bytearray(bloom_file.read())
+        if len(bloom_filter._array) != (bits + 7) // 8:
+            raise ValueError("{} is truncated".format(path))
+        bloom_filter.count = count
+        return bloom_filter
@@ -0,0 +1,118 @@
+import atexit
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+
+logger = logging.getLogger('info_logger')
+error_logger = logging.getLogger('error_logger')
+
+
+def browser_memory_mb(browser):
+    """
+    This function returns the resident memory of a browser process in MB, or None when it can't be read.
+    """
+    try:
+        pid = browser.service.process.pid
+        with open("/proc/{}/status".format(pid)) as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except (AttributeError, OSError, ValueError):
+        pass
+    return None
+
+
+class BrowserPool:
+    """
+    Keeps up to size headless browsers alive across searches. A browser is checked out for one page and checked back
+    in afterwards, and is recycled after max_pages pages, when it uses more than max_memory_mb of memory or when the
+    page failed. All the browsers are shut down on close, which also runs when the process exits.
+    """
+
+    def __init__(self, factory, size=2, max_pages=50, max_memory_mb=500):
+        """
+        :param factory: a callable without arguments that starts a new browser.
+        :param size: the maximal number of browsers alive at the same time.
+        :param max_pages: the number of pages a browser loads before it is replaced.
+        :param max_memory_mb: the resident memory above which a browser is replaced.
+        """
+        self.factory = factory
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle = queue.LifoQueue()
+        self._pages = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        atexit.register(self.close)
+
+    def checkout(self):
+        """
+        This function returns a warm browser, starting a new one if none is idle. Blocks while size browsers are
+        checked out.
+        """
+        if self._closed:
+            raise RuntimeError("browser pool is closed")
+        self._slots.acquire()
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            browser = self.factory()
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._pages[browser] = 0
+        logger.info("started a new pooled browser")
+        return browser
+
+    def checkin(self, browser, healthy=True):
+        """
+        This function returns a browser to the pool, or retires it if it is worn out, too big or unhealthy.
+        """
+        with self._lock:
+            self._pages[browser] = self._pages.get(browser, 0) + 1
+            pages = self._pages[browser]
+        memory = browser_memory_mb(browser)
+        if not healthy or self._closed or pages >= self.max_pages or (memory is not None and
+                                                                      memory > self.max_memory_mb):
+            logger.info("recycling browser after {} pages ({} MB)".format(pages, memory))
+            self._quit(browser)
+        else:
+            self._idle.put(browser)
+        self._slots.release()
+
+    @contextmanager
+    def browser(self):
+        """
+        Checks a browser out for the duration of a with block.
+        """
+        browser = self.checkout()
+        healthy = False
+        try:
+            yield browser
+            healthy = True
+        finally:
+            self.checkin(browser, healthy)
+
+    def _quit(self, browser):
+        with self._lock:
+            self._pages.pop(browser, None)
+        try:
+            browser.quit()
+        except Exception as error:
+            error_logger.error("Failed to quit browser: {}".format(error))
+
+    def close(self):
+        """
+        This function shuts down all the idle browsers, browsers still checked out are shut down on checkin.
+        """
+        self._closed = True
+        while True:
+            try:
+                self._quit(self._idle.get_nowait())
+            except queue.Empty:
+                break
@@ -0,0 +1,72 @@
+import argparse
+import csv
+import os
+from geopy.geocoders import Nominatim
+from geopy.extra.rate_limiter import RateLimiter
+from city_state import states_abb, states_long
+from gazetteer import Gazetteer, GAZETTEER_PATH, write_gazetteer
+
+
+def get_arguments():
+    """
+    This function parses the command line arguments.
+    """
+    parser = argparse.ArgumentParser(description="Regenerates the gazetteer of the main US cities and their "
+                                                 "coordinates.")
+    parser.add_argument('--csv', metavar='FILE',
+                        help='a CSV file with city, state, latitude, longitude columns to take coordinates from.')
+    parser.add_argument('--add', action='store_true',
+                        help='also add the cities of the CSV file that are not in the gazetteer yet.')
+    parser.add_argument('--geocode', action='store_true',
+                        help='geocode the cities with Nominatim (one request per second).')
+    parser.add_argument('--refresh', action='store_true',
+                        help='geocode all the cities, not only the ones without coordinates.')
+    parser.add_argument('--output', default=GAZETTEER_PATH, help='the gazetteer file to write.')
+    return parser.parse_args()
+
+
+def read_csv_coordinates(path):
+    """
+    This function reads coordinates from a CSV file of city, state (full name or abbreviation), latitude, longitude.
+    :return: a dictionary of (city, state) to (latitude, longitude).
+    """
+    abb_dict = dict(zip(states_abb, states_long))
+    coordinates = {}
+    with open(path, newline='') as csv_file:
+        for row in csv.reader(csv_file):
+            if len(row) != 4:
+                continue
+            city, state, lat, lon = (value.strip() for value in row)
+            try:
+                coordinates[(city, abb_dict.get(state.upper(), state))] = (float(lat), float(lon))
+            except ValueError:
+                continue  # a header line.
+    return coordinates
+
+
+def main():
+    arguments = get_arguments()
+    places = {}
+    if os.path.exists(arguments.output):
+        places = {(city, state): (lat, lon) if lat is not None else None
+                  for city, state, lat, lon in Gazetteer(arguments.output)}
+    if arguments.csv:
+        for place, coordinates in read_csv_coordinates(arguments.csv).items():
+            if place in places or arguments.add:
+                places[place] = coordinates
+    if arguments.geocode:
+        geocode = RateLimiter(Nominatim(user_agent="my_user_agent").geocode, min_delay_seconds=1)
+        for (city, state), coordinates in places.items():
+            if coordinates is not None and not arguments.refresh:
+                continue
+            location = geocode("{}, {}".format(city, state))
+            if location is not None:
+                places[(city, state)] = (location.latitude, location.longitude)
+    write_gazetteer(arguments.output, [(city, state) + (coordinates or (None, None))
+                                       for (city, state), coordinates in places.items()])
+    missing = sum(1 for coordinates in places.values() if coordinates is None)
+    print("Wrote {} places to {}, {} without coordinates.".format(len(places), arguments.output, missing))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,16 +1,12 @@
-import mysql.connector
 from mysql.connector import Error
 import pandas as pd
+from db_pool import get_connection, get_credentials, mysql_config
 
 
 def create_server_connection(host_name, user_name, user_password):
     connection = None
     try:
-        connection = mysql.connector.connect(
-            host=host_name,
-            user=user_name,
-            passwd=user_password
-        )
+        connection = get_connection(host_name, user_name, user_password)
         print("MySQL Database connection successful")
     except Error as err:
         print(f"Error: '{err}'")
@@ -18,7 +14,7 @@ def create_server_connection(host_name, user_name, user_password):
     return connection
 
 
-connection = create_server_connection("localhost", "root", '1234')
+connection = create_server_connection(mysql_config.get('host', 'localhost'), *get_credentials())
 
 
 def create_database(connection, query):
@@ -30,5 +26,5 @@ def create_database(connection, query):
         print(f"Error: '{err}'")
 
 
-create_database_DataMining = "CREATE DATABASE mining"
+create_database_DataMining = "CREATE DATABASE {}".format(mysql_config.get('database', 'mining'))
 create_database(connection, create_database_DataMining)
\ No newline at end of file
@@ -0,0 +1,90 @@
+import threading
+import time
+from configparser import ConfigParser
+
+# mysql.connector is imported on the first connection, importing this module stays cheap.
+
+config = ConfigParser()
+config.read("jobs_config.ini")
+mysql_config = config['MYSQL']
+
+_pools = {}
+_pools_lock = threading.Lock()
+_local_database = None
+
+
+def use_local_database(path):
+    """
+    This function makes get_connection return connections to a local sqlite database instead of the MySQL server
+    (see local_db.py), None goes back to MySQL.
+    """
+    global _local_database
+    _local_database = path
+
+
+def get_credentials():
+    """
+    This function returns the database user name and password, from the [MYSQL] config section or asked for.
+    """
+    user = mysql_config.get('user') or input("please insert user name")
+    password = mysql_config.get('password') or input("please insert password")
+    return user, password
+
+
+def get_pool(host_name=None, user_name=None, user_password=None, db_name=None):
+    """
+    This function returns the connection pool of a server, user and database, creating it on first use.
+    The host, database and pool size default to the [MYSQL] section of jobs_config.ini.
+    :param db_name: the database the connections use, None to connect to the server only.
+    """
+    host_name = host_name or mysql_config.get('host', 'localhost')
+    from mysql.connector import pooling
+    key = (host_name, user_name, db_name)
+    with _pools_lock:
+        if key not in _pools:
+            connection_args = {'host': host_name, 'user': user_name, 'password': user_password}
+            if db_name is not None:
+                connection_args['database'] = db_name
+            _pools[key] = pooling.MySQLConnectionPool(
+                pool_name="{}_{}".format(mysql_config.get('pool_name', 'mining_pool'), len(_pools)),
+                pool_size=mysql_config.getint('pool_size', 5), **connection_args)
+        return _pools[key]
+
+
+def get_connection(host_name=None, user_name=None, user_password=None, db_name=None):
+    """
+    This function checks a connection out of the pool, waiting up to checkout_timeout seconds when all of them are
+    in use. The connection is pinged first and reconnected if the server dropped it. Closing the connection returns
+    it to the pool.
+    """
+    if _local_database is not None:
+        from local_db import LocalConnection
+        return LocalConnection(_local_database)
+    from mysql.connector import Error, errors
+    pool = get_pool(host_name, user_name, user_password, db_name)
+    deadline = time.monotonic() + mysql_config.getfloat('checkout_timeout', 10)
+    while True:
+        try:
+            connection = pool.get_connection()
+            break
+        except errors.PoolError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+    try:
+        connection.ping(reconnect=True, attempts=mysql_config.getint('reconnect_attempts', 3),
+                        delay=mysql_config.getint('reconnect_delay', 1))
+    except Error:
+        connection.close()
+        raise
+    return connection
+
+
+def close_all():
+    """
+    This function closes the idle connections of all the pools and forgets the pools.
+    """
+    with _pools_lock:
+        for pool in _pools.values():
+            pool._remove_connections()
+        _pools.clear()
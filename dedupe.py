@@ -0,0 +1,130 @@
+import hashlib
+import random
+import re
+import zlib
+
+COMPANY_SUFFIXES = {'inc', 'llc', 'ltd', 'corp', 'corporation', 'co', 'company', 'lp', 'llp', 'plc'}
+TITLE_ABBREVIATIONS = {'sr': 'senior', 'jr': 'junior', 'mgr': 'manager', 'eng': 'engineer', 'ii': '2', 'iii': '3'}
+MASK = (1 << 32) - 1
+
+
+def words(text):
+    return re.sub(r"[^a-z0-9]+", " ", text.casefold().replace("&", " and ")).split()
+
+
+def normalize_company(company):
+    """
+    This function lower-cases a company name, drops its punctuation and legal suffix ("Acme, Inc." -> "acme").
+    """
+    tokens = words(company)
+    while len(tokens) > 1 and tokens[-1] in COMPANY_SUFFIXES:
+        tokens.pop()
+    return " ".join(tokens)
+
+
+def normalize_title(title):
+    """
+    This function lower-cases a job title, drops its punctuation and spells out common abbreviations.
+    """
+    return " ".join(TITLE_ABBREVIATIONS.get(token, token) for token in words(title))
+
+
+def shingles(text, size=3):
+    text = " {} ".format(text)
+    return {text[i:i + size] for i in range(max(len(text) - size + 1, 1))}
+
+
+class DedupeEngine:
+    """
+    Drops the postings of a search that were already seen from any source, before they reach the database.
+    Postings are duplicates when their normalized company and title are equal, like the unique key of open_positions
+    (the location and the date are the ones of the search). With fuzzy matching, postings whose "title company"
+    character shingles are similar enough are duplicates too. Candidates are found with MinHash locality-sensitive
+    hashing, so a posting isn't compared with all the previous ones.
+    """
+
+    def __init__(self, fuzzy=False, threshold=0.8, num_perm=60, bands=10, seed=1):
+        """
+        :param fuzzy: whether near-duplicates are dropped too.
+        :param threshold: the Jaccard similarity of the shingles from which postings are near-duplicates.
+        :param num_perm: the number of MinHash permutations, split into bands of num_perm / bands rows.
+        """
+        self.fuzzy = fuzzy
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = random.Random(seed)
+        self.permutations = [(rng.randrange(1, MASK, 2), rng.randrange(MASK)) for _ in range(self.rows * bands)]
+        self.keys = set()
+        self.buckets = [{} for _ in range(bands)]
+        self.signatures = []
+        self.stats = {}
+
+    def key(self, posting):
+        """
+        This function returns a compact hash of the normalized company and title of a posting.
+        """
+        text = "{}\0{}".format(normalize_company(posting.company), normalize_title(posting.title))
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest()
+
+    def minhash(self, posting_shingles):
+        hashes = [zlib.crc32(shingle.encode('utf-8')) for shingle in posting_shingles]
+        return [min((a * value + b) & MASK for value in hashes) for a, b in self.permutations]
+
+    def is_near_duplicate(self, posting):
+        """
+        This function checks a posting against the similar postings seen before and remembers it.
+        """
+        posting_shingles = shingles("{} {}".format(normalize_title(posting.title),
+                                                   normalize_company(posting.company)))
+        signature = self.minhash(posting_shingles)
+        bands = [tuple(signature[band * self.rows:(band + 1) * self.rows]) for band in range(self.bands)]
+        candidates = set()
+        for band, bucket in zip(bands, self.buckets):
+            candidates.update(bucket.get(band, ()))
+        for candidate in candidates:
+            other = self.signatures[candidate]
+            if len(posting_shingles & other) / len(posting_shingles | other) >= self.threshold:
+                return True
+        index = len(self.signatures)
+        self.signatures.append(posting_shingles)
+        for band, bucket in zip(bands, self.buckets):
+            bucket.setdefault(band, []).append(index)
+        return False
+
+    def is_duplicate(self, posting):
+        """
+        This function checks whether a posting was already seen, counts it in the statistics of its source and
+        remembers it.
+        """
+        stats = self.stats.setdefault(posting.source or 'unknown', {'postings': 0, 'exact': 0, 'fuzzy': 0})
+        stats['postings'] += 1
+        key = self.key(posting)
+        if key in self.keys:
+            stats['exact'] += 1
+            return True
+        self.keys.add(key)
+        if self.fuzzy and self.is_near_duplicate(posting):
+            stats['fuzzy'] += 1
+            return True
+        return False
+
+    def filter(self, postings):
+        """
+        This function yields the postings that are not duplicates.
+        """
+        for posting in postings:
+            if not self.is_duplicate(posting):
+                yield posting
+
+    def report(self):
+        """
+        This function returns a line per source with its number of postings and the share that were duplicates.
+        """
+        lines = []
+        for source, stats in sorted(self.stats.items()):
+            duplicates = stats['exact'] + stats['fuzzy']
+            lines.append("{}: {} postings, {} duplicates ({} exact, {} fuzzy), dedupe ratio {:.1%}".format(
+                source, stats['postings'], duplicates, stats['exact'], stats['fuzzy'],
+                duplicates / stats['postings'] if stats['postings'] else 0))
+        return lines
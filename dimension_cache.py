@@ -0,0 +1,73 @@
+import threading
+
+
+class DimensionCache:
+    """
+    A write-through cache of the surrogate keys of the titles and location tables, so resolving the id of a title
+    or a location that was already seen costs no round-trip. The cache is warmed in bulk from the database on first
+    use and updated on every insert.
+    """
+
+    def __init__(self):
+        self.title_ids = {}
+        self.location_ids = {}
+        self.warmed = False
+        self._lock = threading.Lock()
+
+    def warm(self, cursor):
+        """
+        This function loads all the existing titles and locations with one query per table.
+        """
+        cursor.execute("""SELECT title, title_id FROM titles""")
+        title_ids = dict(cursor.fetchall())
+        cursor.execute("""SELECT location_name, location_id FROM location""")
+        location_ids = dict(cursor.fetchall())
+        with self._lock:
+            self.title_ids.update(title_ids)
+            self.location_ids.update(location_ids)
+            self.warmed = True
+
+    def title_id(self, cursor, title):
+        """
+        This function returns the id of a title, inserting the title if it is new.
+        """
+        if not self.warmed:
+            self.warm(cursor)
+        if title not in self.title_ids:
+            cursor.execute("""INSERT IGNORE INTO titles (title) VALUES (%s)""", (title,))
+            title_id = cursor.lastrowid
+            if not title_id:
+                cursor.execute("""SELECT title_id from titles where title=(%s)""", (title,))
+                title_id = cursor.fetchone()[0]
+            with self._lock:
+                self.title_ids[title] = title_id
+        return self.title_ids[title]
+
+    def location_id(self, cursor, location_name, lat, lon):
+        """
+        This function returns the id of a location, inserting the location with its coordinates if it is new.
+        """
+        if not self.warmed:
+            self.warm(cursor)
+        if location_name not in self.location_ids:
+            cursor.execute("""INSERT IGNORE INTO location (location_name, latitude, longitude)
+                              VALUES (%s, %s, %s)""", (location_name, lat, lon))
+            location_id = cursor.lastrowid
+            if not location_id:
+                cursor.execute("""SELECT location_id from location where location_name=(%s)""", (location_name,))
+                location_id = cursor.fetchone()[0]
+            with self._lock:
+                self.location_ids[location_name] = location_id
+        return self.location_ids[location_name]
+
+    def clear(self):
+        """
+        This function drops everything cached, e.g. after a failed transaction that may have rolled back inserts.
+        """
+        with self._lock:
+            self.title_ids.clear()
+            self.location_ids.clear()
+            self.warmed = False
+
+
+dimension_cache = DimensionCache()
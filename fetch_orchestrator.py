@@ -0,0 +1,43 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+logger = logging.getLogger('info_logger')
+
+
+class FetchTimeoutError(Exception):
+    """
+    Raised when a source did not return within its timeout.
+    """
+
+
+def fetch_all(tasks, timeouts=None, default_timeout=60):
+    """
+    This function runs independent I/O calls at the same time and returns their results together, so the time of a
+    search is the time of its slowest source instead of the sum of all of them.
+    :param tasks: a dictionary of source name to a callable without arguments that fetches from that source.
+    :param timeouts: a dictionary of source name to the number of seconds that source is allowed to take.
+    :param default_timeout: the timeout of sources that are missing from timeouts.
+    :return: a dictionary of source name to the result of its callable.
+    Raises FetchTimeoutError if a source is too slow, or the exception of the first source that failed.
+    """
+    timeouts = timeouts or {}
+    executor = ThreadPoolExecutor(max_workers=len(tasks))
+    start = time.perf_counter()
+    futures = {name: executor.submit(task) for name, task in tasks.items()}
+    results = {}
+    try:
+        for name, future in futures.items():
+            remaining = start + timeouts.get(name, default_timeout) - time.perf_counter()
+            try:
+                results[name] = future.result(timeout=max(remaining, 0))
+            except TimeoutError:
+                raise FetchTimeoutError("{} did not respond within {} seconds".format(
+                    name, timeouts.get(name, default_timeout)))
+            logger.info("fetched {} after {:.2f}s".format(name, time.perf_counter() - start))
+    finally:
+        # A source that timed out keeps its thread until it returns, but the search doesn't wait for it.
+        for future in futures.values():
+            future.cancel()
+        executor.shutdown(wait=False)
+    return results
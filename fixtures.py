@@ -0,0 +1,163 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from geopy.adapters import RequestsAdapter
+
+logger = logging.getLogger('info_logger')
+error_logger = logging.getLogger('error_logger')
+
+# headers that describe the bytes on the wire, the recorded body is already decoded
+DROPPED_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding', 'connection')
+
+
+def fixture_name(method, url):
+    """
+    This function returns the file name of the fixture of a request.
+    """
+    return hashlib.sha256("{} {}".format(method, url).encode()).hexdigest()
+
+
+class FixtureStore:
+    """
+    A directory of recorded HTTP responses: every response is a <name>.json file with the request and the status and
+    headers of the response, and a <name>.body file with its body.
+    """
+
+    def __init__(self, directory):
+        self.directory = os.path.join(directory, 'http')
+        os.makedirs(self.directory, exist_ok=True)
+
+    def save(self, method, url, status, headers, body):
+        name = fixture_name(method, url)
+        with open(os.path.join(self.directory, name + '.body'), 'wb') as body_file:
+            body_file.write(body)
+        with open(os.path.join(self.directory, name + '.json'), 'w') as meta_file:
+            json.dump({'method': method, 'url': url, 'status': status, 'headers': headers}, meta_file, indent=1)
+
+    def load(self, method, url):
+        """
+        This function returns the status, headers and body recorded for a request, or None.
+        """
+        name = fixture_name(method, url)
+        try:
+            with open(os.path.join(self.directory, name + '.json')) as meta_file:
+                meta = json.load(meta_file)
+            with open(os.path.join(self.directory, name + '.body'), 'rb') as body_file:
+                body = body_file.read()
+        except FileNotFoundError:
+            return None
+        return meta['status'], meta['headers'], body
+
+
+class RecordingAdapter(HTTPAdapter):
+    """
+    A requests transport adapter that saves every response it gets to a FixtureStore.
+    """
+
+    def __init__(self, store, **kwargs):
+        super().__init__(**kwargs)
+        self.store = store
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        headers = {name: value for name, value in response.headers.items() if name.lower() not in DROPPED_HEADERS}
+        self.store.save(request.method, request.url, response.status_code, headers, response.content)
+        return response
+
+
+def recording_geopy_adapter(store):
+    """
+    This function returns a geopy adapter_factory whose adapters save the geocoder's responses to a FixtureStore.
+    """
+    def adapter_factory(proxies, ssl_context):
+        adapter = RequestsAdapter(proxies=proxies, ssl_context=ssl_context)
+        adapter.session.mount('http://', RecordingAdapter(store))
+        adapter.session.mount('https://', RecordingAdapter(store))
+        return adapter
+    return adapter_factory
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    """
+    An HTTP server answering every request in its own thread (http.server only has one from Python 3.7).
+    """
+    daemon_threads = True
+
+
+class FixtureServer:
+    """
+    A local HTTP server answering requests with the responses of a FixtureStore. The original url of a request is in
+    its path: http://127.0.0.1:<port>/<scheme>/<host>/<path> serves what <scheme>://<host>/<path> answered when it
+    was recorded, and 404 when it wasn't.
+    """
+
+    def __init__(self, store, host='127.0.0.1', port=0):
+        self.store = store
+        fixture_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                fixture_server.serve(self)
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def netloc(self):
+        return "{}:{}".format(*self._server.server_address[:2])
+
+    def local_url(self, url):
+        """
+        This function returns the url of the server that serves the recording of url.
+        """
+        parts = urlsplit(url)
+        return "http://{}/{}/{}{}{}".format(self.netloc, parts.scheme, parts.netloc, parts.path,
+                                           "?" + parts.query if parts.query else "")
+
+    def serve(self, handler):
+        scheme, _, rest = handler.path.lstrip('/').partition('/')
+        url = "{}://{}".format(scheme, rest)
+        recorded = self.store.load(handler.command, url)
+        if recorded is None:
+            error_logger.error("No fixture recorded for {} {}".format(handler.command, url))
+            handler.send_error(404, "No fixture recorded")
+            return
+        status, headers, body = recorded
+        handler.send_response(status)
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.send_header('Content-Length', str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def start(self):
+        self._thread.start()
+        logger.info("serving fixtures from {} on {}".format(self.store.directory, self.netloc))
+        return self
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class ReplayAdapter(HTTPAdapter):
+    """
+    A requests transport adapter that sends every request to a FixtureServer instead of its site.
+    """
+
+    def __init__(self, server, **kwargs):
+        super().__init__(**kwargs)
+        self.server = server
+
+    def send(self, request, **kwargs):
+        request.url = self.server.local_url(request.url)
+        return super().send(request, **kwargs)
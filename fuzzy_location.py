@@ -0,0 +1,116 @@
+import heapq
+import re
+from collections import Counter
+from location_index import get_location_index
+
+# Abbreviations that are spelled out in the city names.
+ABBREVIATIONS = {'st': 'saint', 'ste': 'sainte', 'ft': 'fort', 'mt': 'mount', 'pt': 'point', 'n': 'north',
+                 's': 'south', 'e': 'east', 'w': 'west'}
+
+
+def normalize(name):
+    """
+    This function lower-cases a city name, drops its punctuation and spells out the common abbreviations.
+    """
+    words = re.sub(r"[^a-z0-9 ]", " ", name.lower()).split()
+    return " ".join(ABBREVIATIONS.get(word, word) for word in words)
+
+
+def trigrams(name):
+    padded = "  {} ".format(name)
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(first, second, limit):
+    """
+    This function returns the Levenshtein distance between two strings, or limit + 1 once it is larger than limit.
+    """
+    if abs(len(first) - len(second)) > limit:
+        return limit + 1
+    previous = list(range(len(second) + 1))
+    for i, first_char in enumerate(first, 1):
+        current = [i]
+        for j, second_char in enumerate(second, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (first_char != second_char)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class FuzzyLocationResolver:
+    """
+    Finds the closest known city names to a misspelled one. Candidates are taken from an index of the trigrams of the
+    normalized names, and only the few sharing the most trigrams are compared by edit distance, so a lookup doesn't
+    scan all the cities.
+    """
+
+    def __init__(self, index, candidates=10):
+        """
+        :param index: the LocationIndex of the known cities.
+        :param candidates: the number of names compared by edit distance in each lookup.
+        """
+        self.index = index
+        self.candidates = candidates
+        self.names = {}
+        self.states = {}
+        self.postings = {}
+        for city in index.city_names.values():
+            key = normalize(city)
+            self.names.setdefault(key, city)
+            self.states.setdefault(key, set()).update(index.states_of(city))
+            for trigram in trigrams(key):
+                self.postings.setdefault(trigram, []).append(key)
+
+    def suggest(self, city, state=None, limit=5):
+        """
+        This function returns up to limit known cities closest to city, as (city, edit distance) pairs.
+        Cities further than a third of the length of the name are not suggested.
+        :param state: when given, only cities of this state (name or abbreviation) are suggested.
+        """
+        key = normalize(city)
+        state_name = self.index.state_name(state) if state else None
+        shared = Counter()
+        for trigram in trigrams(key):
+            shared.update(self.postings.get(trigram, ()))
+        if state_name is not None:
+            shared = {candidate: count for candidate, count in shared.items()
+                      if state_name in self.states[candidate]}
+        max_distance = max(2, len(key) // 3)
+        scored = []
+        for candidate in heapq.nlargest(self.candidates, shared, key=shared.get):
+            distance = edit_distance(key, candidate, max_distance)
+            if distance <= max_distance:
+                scored.append((distance, self.names[candidate]))
+        scored.sort()
+        return [(name, distance) for distance, name in scored[:limit]]
+
+    def resolve(self, city, state=None):
+        """
+        This function returns the known city that city is a confident spelling of, None if there is none.
+        A match is confident when the names are equal once normalized, or when the closest city is within a small
+        edit distance and strictly closer than the next one.
+        """
+        suggestions = self.suggest(city, state, limit=2)
+        if not suggestions:
+            return None
+        best, distance = suggestions[0]
+        if distance == 0:
+            return best
+        unique = len(suggestions) == 1 or suggestions[1][1] > distance
+        if unique and distance <= max(1, len(normalize(city)) // 6):
+            return best
+        return None
+
+
+_resolver = None
+
+
+def get_fuzzy_resolver():
+    """
+    This function returns the FuzzyLocationResolver of all the main cities in the US, built on the first call.
+    """
+    global _resolver
+    if _resolver is None:
+        _resolver = FuzzyLocationResolver(get_location_index())
+    return _resolver
@@ -0,0 +1,121 @@
+import math
+import mmap
+import os
+import struct
+import threading
+from bisect import bisect_left
+
+GAZETTEER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gazetteer.dat")
+
+# File layout: a header (magic, number of places, size of the names block), the names block ("city|state" lines
+# sorted case-insensitively) and then a latitude, longitude pair of doubles per place in the same order.
+# Places without known coordinates hold NaN.
+MAGIC = b"GZT1"
+HEADER = struct.Struct("<4sII")
+COORDINATES = struct.Struct("<dd")
+
+
+def sort_key(city, state):
+    return "{}|{}".format(city, state).lower()
+
+
+class Gazetteer:
+    """
+    A read-only table of (city, state) to latitude and longitude, memory-mapped from a compact binary file.
+    The file is only opened on the first lookup.
+    """
+
+    def __init__(self, path=GAZETTEER_PATH):
+        self.path = path
+        self._places = None
+        self._keys = None
+        self._map = None
+        self._offset = 0
+        self._lock = threading.Lock()
+
+    def _load(self):
+        with self._lock:
+            if self._places is not None:
+                return
+            with open(self.path, "rb") as gazetteer_file:
+                data = mmap.mmap(gazetteer_file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, count, names_size = HEADER.unpack_from(data, 0)
+            if magic != MAGIC:
+                raise ValueError("{} is not a gazetteer file".format(self.path))
+            names = data[HEADER.size:HEADER.size + names_size].decode("utf-8")
+            places = [tuple(line.split("|")) for line in names.split("\n")] if count else []
+            self._keys = [sort_key(city, state) for city, state in places]
+            self._offset = HEADER.size + names_size
+            self._map = data
+            self._places = places
+
+    def coordinates(self, index):
+        """
+        This function returns the latitude and longitude of the place at index, None if they aren't known.
+        """
+        lat, lon = COORDINATES.unpack_from(self._map, self._offset + index * COORDINATES.size)
+        if math.isnan(lat) or math.isnan(lon):
+            return None
+        return lat, lon
+
+    def lookup(self, city, state):
+        """
+        This function returns the latitude and longitude of a city, None if it isn't in the gazetteer.
+        :param state: the full state name.
+        """
+        if self._places is None:
+            self._load()
+        key = sort_key(city, state)
+        index = bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            return self.coordinates(index)
+        return None
+
+    def places(self):
+        """
+        This function returns the (city, state) names of all the places, without reading their coordinates.
+        """
+        if self._places is None:
+            self._load()
+        return list(self._places)
+
+    def __iter__(self):
+        """
+        Yields (city, state, latitude, longitude) of all the places, latitude and longitude are None if unknown.
+        """
+        if self._places is None:
+            self._load()
+        for index, (city, state) in enumerate(self._places):
+            yield (city, state) + (self.coordinates(index) or (None, None))
+
+    def __len__(self):
+        if self._places is None:
+            self._load()
+        return len(self._places)
+
+
+def write_gazetteer(path, places):
+    """
+    This function writes a gazetteer file.
+    :param places: an iterable of (city, state, latitude, longitude), latitude and longitude may be None.
+    """
+    places = sorted(places, key=lambda place: sort_key(place[0], place[1]))
+    names = "\n".join("{}|{}".format(city, state) for city, state, _, _ in places).encode("utf-8")
+    with open(path, "wb") as gazetteer_file:
+        gazetteer_file.write(HEADER.pack(MAGIC, len(places), len(names)))
+        gazetteer_file.write(names)
+        for _, _, lat, lon in places:
+            gazetteer_file.write(COORDINATES.pack(float("nan") if lat is None else lat,
+                                                  float("nan") if lon is None else lon))
+
+
+gazetteer = Gazetteer()
+
+
+def lookup(city, state):
+    """
+    This function returns the latitude and longitude of a city in the bundled gazetteer, None if it isn't known.
+    """
+    if not os.path.exists(gazetteer.path):
+        return None
+    return gazetteer.lookup(city, state)
@@ -0,0 +1,116 @@
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger('info_logger')
+error_logger = logging.getLogger('error_logger')
+
+
+class GeocodeCache:
+    """
+    A layered cache in front of a geocoder. A place is looked up in an in-memory LRU, then in an offline gazetteer,
+    then in a local sqlite store, then in the location table of the database, and only then geocoded over the
+    network. Whatever is found is written back to the faster layers. Entries older than ttl seconds are ignored and
+    the layers are bounded in size, the least recently used (memory) or oldest (disk) entries are evicted first.
+    """
+
+    def __init__(self, geocode, path, ttl=365 * 24 * 3600, memory_entries=1024, disk_entries=100000,
+                 connection_factory=None, offline_lookup=None):
+        """
+        :param geocode: a callable that gets a place and returns its latitude and longitude over the network.
+        :param path: the path of the sqlite store.
+        :param ttl: the number of seconds an entry is valid for.
+        :param memory_entries: the maximal number of places kept in memory.
+        :param disk_entries: the maximal number of places kept in the sqlite store.
+        :param connection_factory: an optional callable returning a database connection to read the location table
+        with, the connection is closed after the lookup.
+        :param offline_lookup: an optional callable that gets a place and returns its latitude and longitude, or None,
+        without any I/O (the bundled gazetteer). Its answers are only kept in memory.
+        """
+        self.geocode = geocode
+        self.ttl = ttl
+        self.memory_entries = memory_entries
+        self.disk_entries = disk_entries
+        self.connection_factory = connection_factory
+        self.offline_lookup = offline_lookup
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._store = sqlite3.connect(path, check_same_thread=False)
+        self._store.execute("""CREATE TABLE IF NOT EXISTS geocodes (
+                                 place TEXT PRIMARY KEY,
+                                 latitude REAL,
+                                 longitude REAL,
+                                 stored_at REAL)""")
+        self._store.execute("""CREATE INDEX IF NOT EXISTS geocodes_stored_at ON geocodes (stored_at)""")
+        self._store.commit()
+
+    def get(self, place):
+        """
+        This function returns the latitude and longitude of a place from the fastest layer that has it.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(place)
+            if entry is not None and now - entry[2] < self.ttl:
+                self._memory.move_to_end(place)
+                return entry[0], entry[1]
+        if self.offline_lookup is not None:
+            coordinates = self.offline_lookup(place)
+            if coordinates is not None:
+                self._remember(place, coordinates[0], coordinates[1], now)
+                return coordinates
+        with self._lock:
+            row = self._store.execute("""SELECT latitude, longitude, stored_at FROM geocodes WHERE place = ?""",
+                                      (place,)).fetchone()
+        if row is not None and now - row[2] < self.ttl:
+            self._remember(place, row[0], row[1], row[2])
+            return row[0], row[1]
+        coordinates = self._from_location_table(place)
+        if coordinates is None:
+            coordinates = self.geocode(place)
+            logger.info("geocoded {} over the network".format(place))
+        self._remember(place, coordinates[0], coordinates[1], now, persist=True)
+        return coordinates
+
+    def _from_location_table(self, place):
+        if self.connection_factory is None:
+            return None
+        connection = None
+        try:
+            connection = self.connection_factory()
+            cursor = connection.cursor()
+            cursor.execute("""SELECT latitude, longitude FROM location WHERE location_name = %s""", (place,))
+            row = cursor.fetchone()
+            cursor.close()
+        except Exception as error:
+            error_logger.error("Failed to read the location table: {}".format(error))
+            return None
+        finally:
+            if connection is not None:
+                connection.close()
+        if row is None or row[0] is None or row[1] is None:
+            return None
+        return float(row[0]), float(row[1])
+
+    def _remember(self, place, lat, lon, stored_at, persist=False):
+        with self._lock:
+            self._memory[place] = (lat, lon, stored_at)
+            self._memory.move_to_end(place)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+            if persist:
+                self._store.execute("""INSERT OR REPLACE INTO geocodes (place, latitude, longitude, stored_at)
+                                       VALUES (?, ?, ?, ?)""", (place, lat, lon, stored_at))
+                self._evict()
+                self._store.commit()
+
+    def _evict(self):
+        self._store.execute("""DELETE FROM geocodes WHERE stored_at < ?""", (time.time() - self.ttl,))
+        self._store.execute("""DELETE FROM geocodes WHERE place IN (
+                                 SELECT place FROM geocodes ORDER BY stored_at DESC LIMIT -1 OFFSET ?)""",
+                            (self.disk_entries,))
+
+    def close(self):
+        self._store.close()
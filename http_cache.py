@@ -0,0 +1,201 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from requests.adapters import HTTPAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+logger = logging.getLogger('info_logger')
+
+# headers that describe the bytes on the wire, the cached body is already decoded
+DROPPED_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding', 'connection')
+
+
+def cache_key(method, url):
+    """
+    This function returns the key of a request: a hash of its method and of its url with sorted query parameters, so
+    the same parameters passed in another order hit the same entry.
+    """
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    normalized = urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, query, ''))
+    return hashlib.sha256("{} {}".format(method, normalized).encode()).hexdigest()
+
+
+class HTTPCache:
+    """
+    A local store of HTTP responses in sqlite. Entries are keyed by method and url, and their bodies are stored
+    zlib-compressed and content-addressed (by the sha256 of the body), so pages that are byte for byte equal are
+    stored once. When the bodies take more than max_bytes, the least recently used entries are evicted.
+    """
+
+    def __init__(self, path, max_bytes=200 * 1024 * 1024, compression_level=6):
+        self.max_bytes = max_bytes
+        self.compression_level = compression_level
+        self._lock = threading.Lock()
+        self._store = sqlite3.connect(path, check_same_thread=False)
+        self._store.executescript("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT,
+                status INTEGER,
+                headers TEXT,
+                body_hash TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL,
+                accessed_at REAL);
+            CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+            CREATE INDEX IF NOT EXISTS responses_body_hash ON responses (body_hash);
+            CREATE TABLE IF NOT EXISTS bodies (
+                hash TEXT PRIMARY KEY,
+                data BLOB,
+                size INTEGER);""")
+        self._store.commit()
+
+    def get(self, key):
+        """
+        This function returns the cached entry of a key as a dict (status, headers, body, etag, last_modified and
+        stored_at), or None.
+        """
+        with self._lock:
+            row = self._store.execute("""SELECT r.url, r.status, r.headers, b.data, r.etag, r.last_modified,
+                                                r.stored_at
+                                         FROM responses r JOIN bodies b ON b.hash = r.body_hash
+                                         WHERE r.key = ?""", (key,)).fetchone()
+            if row is None:
+                return None
+            self._store.execute("""UPDATE responses SET accessed_at = ? WHERE key = ?""", (time.time(), key))
+            self._store.commit()
+        return {'url': row[0], 'status': row[1], 'headers': json.loads(row[2]), 'body': zlib.decompress(row[3]),
+                'etag': row[4], 'last_modified': row[5], 'stored_at': row[6]}
+
+    def put(self, key, url, status, headers, body):
+        """
+        This function stores a response, and evicts the least recently used ones if the cache got too big.
+        """
+        body_hash = hashlib.sha256(body).hexdigest()
+        validators = CaseInsensitiveDict(headers)  # servers send "ETag", "Etag" or "etag".
+        data = zlib.compress(body, self.compression_level)
+        now = time.time()
+        with self._lock:
+            self._store.execute("""INSERT OR IGNORE INTO bodies (hash, data, size) VALUES (?, ?, ?)""",
+                                (body_hash, data, len(data)))
+            self._store.execute("""INSERT OR REPLACE INTO responses
+                                   (key, url, status, headers, body_hash, etag, last_modified, stored_at, accessed_at)
+                                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                                (key, url, status, json.dumps(dict(headers)), body_hash, validators.get('ETag'),
+                                 validators.get('Last-Modified'), now, now))
+            self._evict()
+            self._store.commit()
+
+    def touch(self, key):
+        """
+        This function marks an entry as fresh again, after the site answered 304 Not Modified.
+        """
+        now = time.time()
+        with self._lock:
+            self._store.execute("""UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?""",
+                                (now, now, key))
+            self._store.commit()
+
+    def size(self):
+        """
+        This function returns the number of bytes the compressed bodies take.
+        """
+        with self._lock:
+            return self._store.execute("""SELECT COALESCE(SUM(size), 0) FROM bodies""").fetchone()[0]
+
+    def _evict(self):
+        total = self._store.execute("""SELECT COALESCE(SUM(size), 0) FROM bodies""").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        entries = self._store.execute("""SELECT r.key, r.body_hash, b.size FROM responses r
+                                         JOIN bodies b ON b.hash = r.body_hash
+                                         ORDER BY r.accessed_at""").fetchall()
+        for key, body_hash, size in entries:
+            if total <= self.max_bytes:
+                break
+            self._store.execute("""DELETE FROM responses WHERE key = ?""", (key,))
+            if self._store.execute("""SELECT 1 FROM responses WHERE body_hash = ? LIMIT 1""",
+                                   (body_hash,)).fetchone() is None:
+                self._store.execute("""DELETE FROM bodies WHERE hash = ?""", (body_hash,))
+                total -= size
+        logger.info("evicted HTTP cache entries down to {} bytes".format(total))
+
+    def close(self):
+        with self._lock:
+            self._store.close()
+
+
+class CachingAdapter(HTTPAdapter):
+    """
+    A requests transport adapter that answers GET requests from an HTTPCache. Every source (a url prefix) has its own
+    ttl: a response younger than its source's ttl is returned without a request, an older one is revalidated with
+    If-None-Match / If-Modified-Since when the site gave an ETag / Last-Modified, and refetched otherwise. Requests
+    to urls without a ttl are not cached.
+    """
+
+    def __init__(self, cache, ttls, default_ttl=None, **kwargs):
+        """
+        :param cache: the HTTPCache to use.
+        :param ttls: a dict of url prefix to the number of seconds its responses are fresh for, the longest matching
+        prefix wins.
+        :param default_ttl: the ttl of the other urls, None to not cache them.
+        """
+        super().__init__(**kwargs)
+        self.cache = cache
+        self.ttls = sorted(ttls.items(), key=lambda item: len(item[0]), reverse=True)
+        self.default_ttl = default_ttl
+
+    def send(self, request, **kwargs):
+        ttl = self.ttl_of(request.url)
+        if request.method != 'GET' or ttl is None or kwargs.get('stream'):
+            return super().send(request, **kwargs)
+        key = cache_key(request.method, request.url)
+        entry = self.cache.get(key)
+        if entry is not None:
+            if time.time() - entry['stored_at'] < ttl:
+                return self.build_cached_response(request, entry)
+            if entry['etag']:
+                request.headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                request.headers['If-Modified-Since'] = entry['last_modified']
+        response = super().send(request, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            self.cache.touch(key)
+            response.close()
+            return self.build_cached_response(request, entry)
+        if response.status_code == 200:
+            headers = {name: value for name, value in response.headers.items()
+                       if name.lower() not in DROPPED_HEADERS}
+            self.cache.put(key, request.url, response.status_code, headers, response.content)
+        return response
+
+    def ttl_of(self, url):
+        """
+        This function returns the ttl of the longest url prefix matching url, or the default ttl.
+        """
+        for prefix, ttl in self.ttls:
+            if url.startswith(prefix):
+                return ttl
+        return self.default_ttl
+
+    @staticmethod
+    def build_cached_response(request, entry):
+        response = Response()
+        response.status_code = entry['status']
+        response.reason = 'OK'
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = entry['body']
+        response.url = request.url
+        response.request = request
+        response.from_cache = True
+        return response
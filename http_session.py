@@ -0,0 +1,20 @@
+import requests
+from requests.adapters import HTTPAdapter
+from http_cache import CachingAdapter
+
+
+def create_session(pool_size=10, cache=None, ttls=None):
+    """
+    This function creates a requests session that keeps up to pool_size connections per host alive, so concurrent
+    requests to the same site reuse their connections instead of opening new ones.
+    :param cache: an optional HTTPCache to answer GET requests from.
+    :param ttls: a dict of url prefix to the seconds its cached responses are fresh for (see CachingAdapter).
+    """
+    session = requests.Session()
+    if cache is not None:
+        adapter = CachingAdapter(cache, ttls or {}, pool_connections=pool_size, pool_maxsize=pool_size)
+    else:
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
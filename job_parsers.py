@@ -0,0 +1,105 @@
+import datetime
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
+from lxml import etree
+from job_posting import JobPosting
+
+
+def has_class(name):
+    return "contains(concat(' ', normalize-space(@class), ' '), ' {} ')".format(name)
+
+
+# The XPath equivalents of the BeautifulSoup lookups, compiled once.
+CARDS = etree.XPath("//section[{}]".format(has_class('card-content')))
+COMPANY = etree.XPath("(.//div[{}])[1]".format(has_class('company')))
+LOCATION = etree.XPath("(.//div[{}])[1]".format(has_class('location')))
+FIRST_DIV = etree.XPath("(.//div)[1]")
+FIRST_H2 = etree.XPath("(.//h2)[1]")
+FIRST_A = etree.XPath("(.//a)[1]")
+FIRST_SPAN = etree.XPath("(.//span)[1]")
+META = etree.XPath("(.//div[@class='meta flex-col'])[1]")
+FIRST_TIME = etree.XPath("(.//time)[1]")
+
+
+def clean(text):
+    return text.replace("\n", "").replace("\r", "")
+
+
+def posted_date(date_str, present_time):
+    """
+    This function converts the posting time of a card ("Posted today" or "3 days ago") to a date string.
+    """
+    if date_str == "Posted today":
+        posted_time = datetime.datetime.now().isoformat()
+    else:
+        posted_time = (present_time - datetime.timedelta(int(date_str.split(" ")[0]))).isoformat()
+    return posted_time.split("T")[0]
+
+
+def parse_soup_cards(jobs):
+    """
+    This function reads the company, location, title and date of the BeautifulSoup job cards that have a company.
+    :return: a list of JobPosting.
+    """
+    jobs_output = []
+    present_time = datetime.datetime.now()
+    for job in jobs:
+        if job.find('div', class_='company') is not None:
+            cur_results = []
+            cur_results.append(clean(job.find('div', class_='company').span.text))
+            cur_results.append(clean(job.find('div', class_='location').span.text))
+            cur_results.append(clean(job.div.h2.a.text))
+            date_str = clean(job.find('div', class_='meta flex-col').time.text)
+            cur_results.append(posted_date(date_str, present_time))
+            jobs_output.append(JobPosting(*cur_results, source='monster'))
+    return jobs_output
+
+
+def parse_jobs_html_parser(html):
+    """
+    This function parses the whole page with BeautifulSoup and the pure-Python html.parser backend.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    return parse_soup_cards(soup.find_all('section', class_="card-content"))  # Searching all the job cards
+
+
+def parse_jobs_strainer(html):
+    """
+    This function builds BeautifulSoup elements only for the job cards (SoupStrainer) with the lxml backend.
+    """
+    soup = BeautifulSoup(html, 'lxml', parse_only=SoupStrainer('section', class_="card-content"))
+    return parse_soup_cards(soup.find_all('section', class_="card-content"))
+
+
+def first(element, xpath):
+    found = xpath(element)
+    return found[0] if found else None
+
+
+def parse_jobs_lxml(html):
+    """
+    This function parses the page with lxml and reads the job cards with XPath.
+    """
+    if not html.strip():
+        return []  # lxml raises ParserError on an empty document, the other parsers find no cards in it.
+    tree = lxml.html.fromstring(html)
+    jobs_output = []
+    present_time = datetime.datetime.now()
+    for job in CARDS(tree):
+        company = first(job, COMPANY)
+        if company is None:
+            continue
+        cur_results = []
+        cur_results.append(clean(first(company, FIRST_SPAN).text_content()))
+        cur_results.append(clean(first(first(job, LOCATION), FIRST_SPAN).text_content()))
+        cur_results.append(clean(first(first(first(job, FIRST_DIV), FIRST_H2), FIRST_A).text_content()))
+        cur_results.append(posted_date(clean(first(first(job, META), FIRST_TIME).text_content()), present_time))
+        jobs_output.append(JobPosting(*cur_results, source='monster'))
+    return jobs_output
+
+
+PARSERS = {
+    'html.parser': parse_jobs_html_parser,
+    'strainer': parse_jobs_strainer,
+    'lxml': parse_jobs_lxml,
+}
@@ -0,0 +1,31 @@
+from collections import namedtuple
+from sys import intern
+
+
+def intern_field(value):
+    """
+    This function returns the interned copy of a string field, other values as they are.
+    """
+    return intern(value) if type(value) is str else value
+
+
+class JobPosting(namedtuple('JobPosting', ['company', 'location', 'title', 'date_posted', 'source'])):
+    """
+    One job posting, as emitted by every source (the Monster scraper and the Adzuna api).
+    An immutable tuple without a per-instance __dict__, its fields keep the positions of the former
+    [company, location, title, date] lists. The company, location, date and source strings are interned, so the few
+    values they take across postings are stored once. Titles are scraped free text and mostly unique, interning them
+    would only fill the interpreter's table of interned strings.
+    """
+    __slots__ = ()
+
+    def __new__(cls, company, location, title, date_posted, source=''):
+        return super().__new__(cls, intern_field(company), intern_field(location), title, intern_field(date_posted),
+                               intern_field(source))
+
+    @property
+    def key(self):
+        """
+        The fields that identify a posting regardless of the source it came from.
+        """
+        return self[:4]
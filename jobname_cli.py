@@ -1,17 +1,33 @@
 import sys
 import argparse
-from bs4 import BeautifulSoup
-import requests
-from city_state import city_to_state_dict, states_abb, states_long
-import datetime
-import mysql.connector
-from geopy.geocoders import Nominatim
-from selenium import webdriver
+from city_state import states_abb, states_long, load_city_states
+from location_index import get_location_index
+from fuzzy_location import get_fuzzy_resolver
+from monster_crawler import crawl_pages
+from pipeline import start_sources, normalize, batched
+from dedupe import DedupeEngine
+from rate_limit import TokenBucket
+from seen_postings import SeenPostings
+from refresh_scheduler import RefreshScheduler
+from work_queue import WorkQueue
+from migrations import migrate
 import os
-from urllib.request import urlopen
 import json
 import logging
 from configparser import ConfigParser
+import csv
+import time
+import multiprocessing.util
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from fetch_orchestrator import fetch_all
+from browser_pool import BrowserPool
+import db_pool
+from dimension_cache import dimension_cache
+from geocode_cache import GeocodeCache
+import gazetteer
+
+# requests, the HTML parsers, mysql.connector, geopy and selenium take most of the start up time, so they are imported
+# by the functions that use them: --help and argument errors don't load them.
 
 config = ConfigParser()
 config.read("jobs_config.ini")
@@ -21,6 +37,9 @@ app_key = config['PARAMETERS']['app_key']
 app_id = config['PARAMETERS']['app_id']
 salaries_url = config['PARAMETERS']['salaries_site']
 url_api = config['PARAMETERS']['url']
+salary_backend = config['PARAMETERS'].get('salary_backend', 'auto')
+insert_chunk_size = config.getint('MYSQL', 'insert_chunk_size')
+fetch_timeouts = {source: config.getfloat('TIMEOUTS', source) for source in config['TIMEOUTS']}
 
 
 formatter = logging.Formatter('%(asctime)s-%(levelname)s-FILE:%(filename)s-FUNC:%(funcName)s-LINE:'
@@ -46,14 +65,50 @@ error_logger = setup_logger('error_logger', 'errors.log')
 error_logger.error('error message: ')
 
 
-def get_parameters():
+def get_arguments():
     """
-    This function gets the parameters needed for the web scraping to take place.
-    :return:  the job name, city and state as titles.
+    This function parses the command line arguments.
+    :return: the parsed arguments namespace.
     """
     parser = argparse.ArgumentParser()
     parser.add_argument('vars', nargs='*', type=str)
-    args = " ".join(parser.parse_args().vars).split(",")
+    parser.add_argument('--batch', metavar='FILE',
+                        help='CSV or JSONL file of "job, city, state" searches to run in one process ("-" for stdin).')
+    parser.add_argument('--autocorrect', action='store_true',
+                        help='replace misspelled city names with the closest known city instead of stopping.')
+    parser.add_argument('--incremental', action='store_true',
+                        help='skip the postings loaded by former runs, the Adzuna search stops paging at the first '
+                             'page of them (the Monster pages have no date order and are all fetched).')
+    parser.add_argument('--workers', type=int, default=1, metavar='N',
+                        help='with --batch or --worker, run the searches in N processes to use N cores.')
+    parser.add_argument('--schedule', action='store_true',
+                        help='keep refreshing all the job and city searches, the stalest and busiest first.')
+    parser.add_argument('--max-runs', type=int, metavar='N',
+                        help='with --schedule or --worker, stop after N searches (per process).')
+    parser.add_argument('--enqueue', action='store_true',
+                        help='add the searches of --batch, or every job in every city (of --states), to the MySQL '
+                             'work queue.')
+    parser.add_argument('--states', metavar='STATES',
+                        help='with --enqueue, the comma separated states whose cities are enqueued.')
+    parser.add_argument('--worker', action='store_true',
+                        help='run the searches of the work queue until it is empty (with --workers N processes).')
+    parser.add_argument('--queue-status', action='store_true', help='print the number of tasks of every status.')
+    fixtures = parser.add_mutually_exclusive_group()
+    fixtures.add_argument('--record', metavar='DIR',
+                          help='save every response of the sites and APIs to the fixture directory DIR.')
+    fixtures.add_argument('--replay', metavar='DIR',
+                          help='serve the responses recorded in DIR from a local server and load into a local sqlite '
+                               'database instead of MySQL, so no network is needed.')
+    return parser.parse_args()
+
+
+def get_parameters(arguments):
+    """
+    This function gets the parameters needed for the web scraping to take place.
+    :param arguments: the parsed command line arguments.
+    :return:  the job name, city and state as titles.
+    """
+    args = " ".join(arguments.vars).split(",")
     if len(args) != 3:
         print("Incorrect number of parameters")
         sys.exit(1)
@@ -63,36 +118,43 @@ def get_parameters():
     return job_name, city, state
 
 
-def check_validity_location(city, state, places_dict, states_abb, states_long):
+def check_validity_location(city, state, index, autocorrect=False):
     """
     This function makes sure the input data of the location is valid
     :param city: the city to do the query at.
     :param state: the state to do the query at.
-    :param places_dict: a dictionary of all the main cities in the US.
-    :return: nothing, but ends the program if the data is not valid.
+    :param index: a LocationIndex of all the main cities in the US.
+    :param autocorrect: whether a misspelled city is replaced by the closest known city of the state (when there is a
+    confident match), otherwise the closest cities are suggested.
+    :return: the city and the full state name, but ends the program if the data is not valid.
     """
-    zip_iterator = zip(states_abb, states_long)
-    abb_dict = dict(zip_iterator)
-    # Check if the state is a valid state name:
-    if state.upper() not in states_abb and state not in states_long:
+    # Check if the state is a valid state name (abbreviation or full name):
+    state_name = index.state_name(state)
+    if state_name is None:
         print("Not a valid state name.")
         error_logger.error("Wrong State! Not a valid state name.")
         sys.exit(1)
-    # Convert abbreviation state name to full stat name
-    if state.upper() in states_abb:
-        state = abb_dict[state.upper()]
     # Check if the city name is valid.
-    if city not in places_dict.keys():
+    city_name = index.city_name(city)
+    if city_name is None and autocorrect:
+        city_name = get_fuzzy_resolver().resolve(city, state_name)
+        if city_name is not None:
+            print("Corrected city {} to {}.".format(city, city_name))
+            logger.info("corrected city {} to {}".format(city, city_name))
+    if city_name is None:
+        suggestions = get_fuzzy_resolver().suggest(city, state_name)
+        if suggestions:
+            print("Did you mean: {}?".format(", ".join(name for name, _ in suggestions)))
         print("This city doesn't exist in the USA.")
         error_logger.error("Wrong city! This city doesn't exist in the USA.")
         sys.exit(1)
     # check if there is a match between city and state:
-    if not places_dict[city] == state:
+    if state_name not in index.states_of(city_name):
         print("City is not located in specific state.")
         error_logger.error("Wrong city or state! There is no matching city in this state.")
         sys.exit(1)
-    logger.info("location - {},{} is valid".format(city, state))
-    return state
+    logger.info("location - {},{} is valid".format(city_name, state_name))
+    return city_name, state_name
 
 
 def check_validity_jobname(job_name):
@@ -107,17 +169,35 @@ def check_validity_jobname(job_name):
     logger.info("job name - {} is valid".format(job_name))
 
 
-def monster_get_content(monster_site, job, location):
+def monster_get_content(monster_site, job, location, session=None, page_number=1):
     """
-    This function gets a job title and a location, and returns a page content of the desired url in the monster website.
-    The search gets up to 250 searches (the maximum amount of searches the page can display)
+    This function gets a job title and a location, and returns a single results page of the search in the monster
+    website (crawl_pages asks for the pages one by one).
+    The page parameter of monster is cumulative: page=10 returns the 25 results of every page from stpage (1 by
+    default) to 10, up to 250 results. Setting stpage to the same page returns only the 25 new results of that page,
+    so every result is downloaded once and an empty page means the search has no more results.
+    :param session: an optional requests session to reuse (keep-alive) across searches.
+    :param page_number: the results page to get, the first one by default.
     """
-    payload = {'q': job, 'where': location, 'page': '10'}  # parameters to insert the url in the request.
-    page = requests.get(monster_site, params=payload)
-    logger.info("Got Monster jobs list.")
+    import requests
+    payload = {'q': job, 'where': location, 'stpage': str(page_number), 'page': str(page_number)}
+    page = (session or requests).get(monster_site, params=payload)
+    logger.info("Got Monster jobs list page {}.".format(page_number))
     return page
 
 
+def monster_get_jobs(monster_site, job, location, session=None, new_jobs=None):
+    """
+    This function gets all the jobs of a search in the monster website, fetching its result pages concurrently.
+    The number of pages and the concurrency are set in the [MONSTER] section of the config.
+    :param new_jobs: an optional callable returning the jobs of a page not seen in former runs (see crawl_pages).
+    :return: a generator of JobPosting with the name of the job offer company, specific location, title and date.
+    """
+    return crawl_pages(lambda page_number: monster_get_content(monster_site, job, location, session, page_number),
+                       get_jobs_page_data, max_pages=config.getint('MONSTER', 'max_pages'),
+                       concurrency=config.getint('MONSTER', 'concurrency'), new_jobs=new_jobs)
+
+
 def monster_get_salaries(salaries_url, city, state, job_name):
     """
     This function gets a job title and a location, and returns a page content of the desired url of salary tool in the
@@ -129,21 +209,51 @@ def monster_get_salaries(salaries_url, city, state, job_name):
     return salaries_site
 
 
-def get_salaries_page_data(salaries_site):
+def create_browser():
+    """
+    This function starts the bundled headless PhantomJS browser.
+    """
+    from selenium import webdriver
+    return webdriver.PhantomJS(os.path.join(os.getcwd(), "phantomjs-2.1.1-linux-x86_64/bin/phantomjs"))
+
+
+def get_salaries_page_data(salaries_site, browser_pool=None, session=None, backend=None):
     """
     This function takes the page of the site with the salaries of the specific job in the specific city, and returns
     the job salaries in that city (10%, median, 90%) and also the median salary for the job national.
+    :param browser_pool: an optional BrowserPool to render with, otherwise a new browser is started and quit after the
+    page loads.
+    :param session: an optional requests session to reuse for the plain HTTP fetch.
+    :param backend: "http" reads the data embedded in the page, "browser" renders the page in PhantomJS and "auto"
+    renders it only when the plain page doesn't hold the data. Defaults to salary_backend from the config.
     """
-    browser = webdriver.PhantomJS(os.path.join(os.getcwd(), "phantomjs-2.1.1-linux-x86_64/bin/phantomjs"))
-    browser.get(salaries_site)
-    html = browser.page_source
-    soup = BeautifulSoup(html, 'html.parser')
-    salaries = soup.find('script').string  # a section inside the html that contains the salaries data.
-    # Salaries of the city that was searched in the search engine:
-    med = int(soup.find('span', {'class': 'avgSalary'}).text.replace(",", ""))
-    prc90 = int(soup.find('span', {'class': 'maxSalary'}).text.replace(",", ""))  # need to change to max
-    prc10 = int(soup.find('span', {'class': 'minSalary'}).text.replace(",", ""))  # need to change to min
-    national = int(soup.find('span', {'class': 'jsx-944507022 nationalSalary'}).text.replace(",", ""))
+    import requests
+    from salary_parser import parse_salaries_html, SalaryDataNotFound
+    backend = backend or salary_backend
+    if backend in ('http', 'auto'):
+        page = (session or requests).get(salaries_site)
+        try:
+            prc90, med, prc10, national = parse_salaries_html(page.text)
+        except SalaryDataNotFound as error:
+            if backend == 'http':
+                raise
+            logger.info("Salaries page needs rendering ({}), using the browser.".format(error))
+        else:
+            logger.info("Salaries data is valid - median = {}, 10th percentile = {}, "
+                        "90th percentile = {},national = {}.".format(med, prc10, prc90, national))
+            return prc90, med, prc10, national
+    if browser_pool is not None:
+        with browser_pool.browser() as browser:
+            browser.get(salaries_site)
+            html = browser.page_source
+    else:
+        browser = create_browser()
+        try:
+            browser.get(salaries_site)
+            html = browser.page_source
+        finally:
+            browser.quit()
+    prc90, med, prc10, national = parse_salaries_html(html)
     logger.info("Salaries data is valid - median = {}, 10th percentile = {}, "
                 "90th percentile = {},national = {}.".format(med, prc10, prc90, national))
     return prc90, med, prc10, national
@@ -151,77 +261,118 @@ def get_salaries_page_data(salaries_site):
 
 def get_jobs_page_data(page):
     """
-    This function takes the page of the site with the specific job and place and name, and output a list of lists where
-    each list contains the name of the job offer company, specific location and title.
-    """
-    soup = BeautifulSoup(page.text, 'html.parser')
-    jobs = soup.find_all('section', class_="card-content")  # Searching all the card contents of jobs
-    jobs_output = []
-    present_time = datetime.datetime.now()
-    for job in jobs:
-        if job.find('div', class_='company') is not None:
-            cur_results = []
-            cur_results.append(job.find('div', class_='company').span.text.replace("\n", "").replace("\r", ""))
-            cur_results.append(job.find('div', class_='location').span.text.replace("\n", "").replace("\r", ""))
-            cur_results.append(job.div.h2.a.text.replace("\r", "").replace("\n", "").replace("\r", ""))
-            date_str = job.find('div', class_='meta flex-col').time.text.replace("\n", "").replace("\r", "")
-            if date_str == "Posted today":
-                posted_time = datetime.datetime.now().isoformat().split("T")[0]
-            else:
-                posted_time = (present_time - datetime.timedelta(int(date_str.split(" ")[0]))).isoformat()
-            cur_results.append(posted_time.split("T")[0])
-            jobs_output.append(cur_results)
-    return jobs_output
+    This function takes the page of the site with the specific job and place and name, and output a list of JobPosting
+    where each one contains the name of the job offer company, specific location, title and date.
+    The page is parsed by job_parser from the [MONSTER] section of the config (see job_parsers.PARSERS).
+    """
+    from job_parsers import PARSERS
+    return PARSERS[config['MONSTER'].get('job_parser', 'lxml')](page.text)
+
+
+def create_adzuna_client(url_api, app_id, app_key, session=None, rate_share=1):
+    """
+    This function creates an AdzunaClient with the settings of the [ADZUNA] section of the config.
+    :param rate_share: the share of the configured request rate this client gets, for processes that run side by side.
+    """
+    adzuna_config = config['ADZUNA']
+    from adzuna_client import AdzunaClient
+    return AdzunaClient(url_api, app_id, app_key, session=session,
+                        results_per_page=adzuna_config.getint('results_per_page'),
+                        max_pages=adzuna_config.getint('max_pages'),
+                        concurrency=adzuna_config.getint('concurrency'),
+                        rate_limiter=TokenBucket(adzuna_config.getfloat('requests_per_second') * rate_share,
+                                                 max(1, int(adzuna_config.getint('burst') * rate_share))),
+                        max_retries=adzuna_config.getint('max_retries'),
+                        backoff=adzuna_config.getfloat('backoff_seconds'),
+                        timeout=fetch_timeouts.get('adzuna', 30))
 
 
-def use_adzuna_api(url_api, app_id, app_key, job_name, location):
+def use_adzuna_api(url_api, app_id, app_key, job_name, location, client=None, new_jobs=None):
     """
     This function extracts jobs data using the api of adzuna
     :param job_name: the job name requested
     :param location:  location of desired job
-    :return: output a list of lists where each list contains the name of the job offer company,
-     specific location and title.
+    :param client: an optional AdzunaClient to reuse (keep-alive connections and a shared rate limit).
+    :param new_jobs: an optional callable returning the jobs of a page not seen in former runs (see
+    AdzunaClient.search).
+    :return: output a generator of JobPosting where each one contains the name of the job offer company,
+     specific location, title and date.
     """
     # app_key = 'c54b61864d1a48221053a5bf3093674d'
     # app_id = '356aad97'
-    job_name_query = "%20".join(job_name.split())
-    location_query = "%20".join(location.split())
-
-    url = url_api.format(app_id, app_key, job_name_query, location_query)
-    response = urlopen(url)
-    results = json.loads(response.read())
-    jobs_output_api = []
-    for item in results["results"]:
-        cur_results = []
-        cur_results.append(item['company']['display_name'])
-        cur_results.append(item['location']['display_name'])
-        cur_results.append(item['title'].replace("<strong>", "").replace("</strong>", ""))
-        cur_results.append(item['created'].split('T')[0].replace("-", "/"))
-        jobs_output_api.append(cur_results)
-    logger.info("retrieved Adzuna web API information successfully")
-    return jobs_output_api
-
-
-def get_lat_lon(place):
+    if client is None:
+        client = create_adzuna_client(url_api, app_id, app_key)
+    return client.search(job_name, location, new_jobs)
+
+
+def lookup_offline(place):
+    """
+    This function returns the latitude and longitude of a known city ("city, state") from the bundled gazetteer,
+    None for other places.
+    """
+    city, _, state = place.rpartition(", ")
+    return gazetteer.lookup(city, state)
+
+
+def get_lat_lon(place, geolocator=None):
     """
     This function gets the latitude and longitude of the city in which the job is searched.
+    Known cities are answered from the bundled gazetteer, other places are geocoded with Nominatim.
     :param place: the city and state
+    :param geolocator: an optional geocoder to reuse across searches.
     :return: latitude and longitude as a tuple.
     """
-    geolocator = Nominatim(user_agent="my_user_agent")
+    coordinates = lookup_offline(place)
+    if coordinates is not None:
+        return coordinates
+    if geolocator is None:
+        from geopy.geocoders import Nominatim
+        geolocator = Nominatim(user_agent="my_user_agent")
     results = geolocator.geocode(place)
     return results.latitude, results.longitude
 
 
+def insert_open_positions(cursor, title_id, location_id, jobs_output, chunk_size=None):
+    """
+    This function loads the scraped jobs into the open_positions table with multi-row INSERT statements, sending
+    chunk_size rows per round-trip instead of one.
+    :param cursor: a cursor of an open connection, the caller commits.
+    :param title_id: the id of the job title of all the jobs.
+    :param location_id: the id of the location of all the jobs.
+    :param jobs_output: a list of the scraped JobPosting.
+    :param chunk_size: the number of rows per statement, defaults to insert_chunk_size from the config.
+    :return: a dictionary with the number of rows attempted, inserted and ignored as duplicates.
+    """
+    chunk_size = chunk_size or insert_chunk_size
+    rows = [(title_id, location_id, job.title, job.company, job.date_posted) for job in jobs_output]
+    inserted = 0
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        query = """INSERT IGNORE INTO open_positions (title_id, location_id,
+                   job_description, company_name, date_posted)
+                   VALUES """ + ", ".join(["(%s, %s, %s, %s, %s)"] * len(chunk))
+        cursor.execute(query, [value for row in chunk for value in row])
+        inserted += cursor.rowcount  # rows skipped by INSERT IGNORE are not counted.
+    return {'attempted': len(rows), 'inserted': inserted, 'duplicates': len(rows) - inserted}
+
+
+class DatabaseLoadError(Exception):
+    """
+    Raised when the jobs of a search could not be loaded into the database.
+    """
+
+
 def update_mysql_tables(host_name, user_name, user_password, db_name, jobs_output,
-                        job_name, place, lat, lon, prc90, med, prc10, national):
+                        job_name, place, lat, lon, prc90, med, prc10, national, connection=None):
     """
     This function injects the values retrieved from the web scraping into the mysql tables.
+    The jobs are consumed in batches of insert_chunk_size and every batch is committed, so rows land while the
+    sources are still being scraped and only one batch is held in memory.
         :param host_name: (of the mysql account).
     :param user_name: (of the mysql account).
     :param user_password: (of the mysql account).
     :param db_name: the database to load onto the data.
-    :param jobs_output: a nested list of the scraped data.
+    :param jobs_output: an iterable (a list or a generator) of the scraped JobPosting.
     :param job_name: the job name as appeared in the search.
     :param place: name of the place typed in the query.
     :param lat: latitude of place typed in the query.
@@ -230,35 +381,19 @@ def update_mysql_tables(host_name, user_name, user_password, db_name, jobs_outpu
     :param med: the median percentile of salaries in the field in the city searched.
     :param prc10: the 10th percentile of salaries in the field in the city searched.
     :param national: the national median salary in the field.
-    :return: Nothing
+    :param connection: an optional open connection to reuse, it is left open when given.
+    :return: the open_positions insert counts (see insert_open_positions), None if the insert failed.
     """
-    connection = None
+    import mysql.connector
+    own_connection = connection is None
+    cursor = None
     try:
-        connection = mysql.connector.connect(host=host_name,
-                                             database=db_name,
-                                             user=user_name,
-                                             password=user_password)
+        if own_connection:
+            connection = db_pool.get_connection(host_name, user_name, user_password, db_name)
         cursor = connection.cursor()
-        # adding values to titles table:
-        mysql_insert_query1 = """INSERT IGNORE INTO titles (title) 
-                                VALUES (%s)"""  # Update auto increment on location id?
-        recordtuple1 = (job_name,)
-        cursor.execute(mysql_insert_query1, recordtuple1)
-        title_id = cursor.lastrowid
-        if title_id == 0:
-            cursor.execute("""SELECT title_id from titles where title=(%s)""", (job_name,))
-            for vals in cursor:
-                title_id = vals[0]
-        # adding values to location table:
-        mysql_insert_query2 = """INSERT IGNORE INTO location (location_name, latitude, longitude) 
-                                VALUES (%s, %s, %s)"""  # Update auto increment on location id?
-        recordtuple2 = (place, lat, lon)
-        cursor.execute(mysql_insert_query2, recordtuple2)
-        location_id = cursor.lastrowid
-        if location_id == 0:
-            cursor.execute("""SELECT location_id from location where location_name=(%s)""", (place,))
-            for vals in cursor:
-                location_id = vals[0]
+        # adding values to titles and location tables, ids that were already seen come from the cache:
+        title_id = dimension_cache.title_id(cursor, job_name)
+        location_id = dimension_cache.location_id(cursor, place, lat, lon)
         # adding values to national_salaries table:
         mysql_insert_query3 = """INSERT IGNORE INTO national_salaries (title_id, national_median_salary) 
                                 VALUES (%s, %s)"""  # Update auto increment on location id?
@@ -270,48 +405,629 @@ def update_mysql_tables(host_name, user_name, user_password, db_name, jobs_outpu
                                 VALUES (%s,%s,%s,%s,%s)"""  # Update auto increment on location id?
         recordtuple4 = (title_id, location_id, med, prc90, prc10)
         cursor.execute(mysql_insert_query4, recordtuple4)
-        for line in jobs_output:
-            # adding values to open_positions table:
-            mysql_insert_query5 = """INSERT IGNORE INTO open_positions (title_id, location_id,
-                                    job_description, company_name, date_posted) 
-                                    VALUES (%s, %s, %s, %s, %s)"""  # Update auto increment on location id?
-            recordtuple3 = (title_id, location_id, line[2], line[0], line[3])
-            cursor.execute(mysql_insert_query5, recordtuple3)
         connection.commit()
+        # adding values to open_positions table:
+        stats = {'attempted': 0, 'inserted': 0, 'duplicates': 0}
+        for batch in batched(jobs_output, insert_chunk_size):
+            for key, value in insert_open_positions(cursor, title_id, location_id, batch).items():
+                stats[key] += value
+            connection.commit()
         print("Record inserted successfully into table")
-        logger.info("{} in {} results were inserted successfully into table open_positions.".format(job_name, place))
+        logger.info("{} in {} results were inserted successfully into table open_positions: {} attempted, {} inserted, "
+                    "{} duplicates ignored.".format(job_name, place, stats['attempted'], stats['inserted'],
+                                                    stats['duplicates']))
+        return stats
     except mysql.connector.Error as error:
+        dimension_cache.clear()  # ids inserted by the failed transaction may not exist.
         print("Failed to insert into MySQL table {}".format(error))
         error_logger.error("Failed to insert into MySQL table {}".format(error))
 
 
     finally:
-        if connection.is_connected():
+        if cursor is not None:
             cursor.close()
-            connection.close()
+        if own_connection and connection is not None and connection.is_connected():
+            connection.close()  # returns the connection to the pool.
             print("MySQL connection is closed")
 
 
-def main():
-    job_name, city, state = get_parameters()  # gets the parameters from the CLI.
-    state = check_validity_location(city, state, city_to_state_dict, states_abb,
-                                    states_long)  # Verifying data is suitable.
+def remove_file(path):
+    """
+    This function removes a file if it exists.
+    """
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def reset_fixtures(fixture_dir):
+    """
+    This function removes the caches and the database a former run left in a fixture directory.
+    """
+    for name in ('geocode_cache.sqlite', 'seen_postings.bloom', 'replay.sqlite'):
+        remove_file(os.path.join(fixture_dir, name))
+
+
+def migrate_replay_database(replay):
+    """
+    This function applies the migrations to the sqlite database of a replay, so it has the indexes of the MySQL
+    database and loading costs the same. It runs once per replay, before any worker process opens the database.
+    """
+    db_pool.use_local_database(os.path.join(replay, 'replay.sqlite'))
+    connection = db_pool.get_connection()
+    try:
+        migrate(connection)
+    finally:
+        connection.close()
+        db_pool.use_local_database(None)
+
+
+def create_seen_postings(fixture_dir=None, save=True):
+    """
+    This function loads the fingerprints of the postings loaded by former runs, from the [INCREMENTAL] path or from a
+    fixture directory.
+    """
+    path = os.path.join(fixture_dir, 'seen_postings.bloom') if fixture_dir else config['INCREMENTAL']['path']
+    return SeenPostings(path, capacity=config.getint('INCREMENTAL', 'capacity'),
+                        error_rate=config.getfloat('INCREMENTAL', 'error_rate'), save=save)
+
+
+def http_cache_ttls():
+    """
+    This function returns the cache ttls of the three sources fetched over HTTP, keyed by the start of their urls.
+    """
+    cache_config = config['HTTP_CACHE']
+    return {monster_site: cache_config.getfloat('monster_ttl'),
+            salaries_url.split('{')[0]: cache_config.getfloat('salaries_ttl'),
+            url_api.split('{')[0]: cache_config.getfloat('adzuna_ttl')}
+
+
+class SharedResources:
+    """
+    Holds the objects that are expensive to create (HTTP session, browser pool and cached geocoder) and the database
+    credentials so they can be shared by all the searches of one process. Database connections come from db_pool.
+    Browsers are only started and the credentials only asked for when first needed.
+    With record, every HTTP response is saved to that fixture directory. With replay, the responses saved in that
+    directory are served by a local FixtureServer and the jobs are loaded into a local sqlite database. Both start
+    with empty HTTP and geocoding caches and read the salaries page over plain HTTP, so every request is recorded.
+    With incremental, the postings loaded by former runs are remembered in seen_postings (see SeenPostings).
+    When this process is one of workers processes of a batch, the parent resets the fixture directory and saves the
+    seen postings, and the Adzuna request rate is shared between the processes.
+    """
+
+    def __init__(self, host_name=None, db_name=None, record=None, replay=None, incremental=False,
+                 credentials=None, workers=1):
+        from geopy.geocoders import Nominatim
+        from http_cache import HTTPCache
+        from http_session import create_session
+        self.host_name = host_name or db_pool.mysql_config.get('host', 'localhost')
+        self.db_name = db_name or db_pool.mysql_config.get('database', 'mining')
+        self.http_cache = None
+        self.fixture_server = None
+        self.salary_backend = salary_backend
+        self._credentials = credentials
+        geocode_path = config['GEOCODE']['cache_path']
+        pool_size = config.getint('MONSTER', 'concurrency') + 2
+        if record or replay:
+            self.salary_backend = 'http'  # pages rendered by the browser can't be recorded.
+            geocode_path = os.path.join(record or replay, 'geocode_cache.sqlite')
+            if workers == 1:
+                reset_fixtures(record or replay)
+        elif config.getboolean('HTTP_CACHE', 'enabled'):
+            self.http_cache = HTTPCache(config['HTTP_CACHE']['path'],
+                                        max_bytes=config.getfloat('HTTP_CACHE', 'max_size_mb') * 1024 * 1024)
+        self.session = create_session(pool_size, self.http_cache, http_cache_ttls())
+        if record or replay:
+            # fixtures is only imported by record and replay runs.
+            from fixtures import FixtureStore, FixtureServer, RecordingAdapter, ReplayAdapter, recording_geopy_adapter
+        if record:
+            store = FixtureStore(record)
+            adapter = RecordingAdapter(store, pool_connections=pool_size, pool_maxsize=pool_size)
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
+            self.geolocator = Nominatim(user_agent="my_user_agent", adapter_factory=recording_geopy_adapter(store))
+        elif replay:
+            self.fixture_server = FixtureServer(FixtureStore(replay)).start()
+            adapter = ReplayAdapter(self.fixture_server, pool_connections=pool_size, pool_maxsize=pool_size)
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
+            nominatim = self.fixture_server.local_url('https://nominatim.openstreetmap.org')
+            self.geolocator = Nominatim(user_agent="my_user_agent", domain=nominatim.split('://', 1)[1],
+                                        scheme='http')
+            if workers == 1:
+                migrate_replay_database(replay)
+            db_pool.use_local_database(os.path.join(replay, 'replay.sqlite'))
+            dimension_cache.clear()  # the ids of another database.
+            self._credentials = ('', '')
+        else:
+            self.geolocator = Nominatim(user_agent="my_user_agent")
+        self.browser_pool = BrowserPool(create_browser,
+                                        size=config.getint('BROWSER_POOL', 'size'),
+                                        max_pages=config.getint('BROWSER_POOL', 'max_pages'),
+                                        max_memory_mb=config.getfloat('BROWSER_POOL', 'max_memory_mb'))
+        self.adzuna_client = create_adzuna_client(url_api, app_id, app_key, self.session, 1 / workers)
+        self.seen_postings = None
+        if incremental:
+            self.seen_postings = create_seen_postings(record or replay, save=workers == 1)
+        self.geocode_cache = GeocodeCache(lambda place: get_lat_lon(place, self.geolocator), geocode_path,
+                                          ttl=config.getfloat('GEOCODE', 'ttl_days') * 24 * 3600,
+                                          memory_entries=config.getint('GEOCODE', 'memory_entries'),
+                                          disk_entries=config.getint('GEOCODE', 'disk_entries'),
+                                          connection_factory=self.connect, offline_lookup=lookup_offline)
+
+    @property
+    def credentials(self):
+        """
+        The database user name and password, from the [MYSQL] config section or asked for once.
+        """
+        if self._credentials is None:
+            self._credentials = db_pool.get_credentials()
+        return self._credentials
+
+    def connect(self):
+        """
+        Checks a connection to the database out of the pool.
+        """
+        user, password = self.credentials
+        return db_pool.get_connection(self.host_name, user, password, self.db_name)
+
+    def close(self):
+        """
+        Shuts down everything that was opened.
+        """
+        self.session.close()
+        self.browser_pool.close()
+        self.geocode_cache.close()
+        if self.http_cache is not None:
+            self.http_cache.close()
+        if self.fixture_server is not None:
+            self.fixture_server.close()
+            db_pool.use_local_database(None)
+
+
+def read_batch_file(path):
+    """
+    This function reads the searches of a batch run.
+    Every line is either a JSON object with "job", "city" and "state" keys (JSONL) or a "job, city, state" CSV row.
+    :param path: the path of the batch file, "-" reads from stdin.
+    :return: a list of (job name, city, state) tuples as titles.
+    """
+    stream = sys.stdin if path == '-' else open(path, newline='')
+    searches = []
+    try:
+        for line in stream:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("{"):
+                item = json.loads(line)
+                row = [item.get('job', item.get('job_name', '')), item.get('city', ''), item.get('state', '')]
+            else:
+                row = next(csv.reader([line]))
+            if len(row) != 3:
+                print("Skipping batch line with incorrect number of parameters: {}".format(line))
+                error_logger.error("Batch line with incorrect number of parameters: {}".format(line))
+                continue
+            searches.append(tuple(value.strip().title() for value in row))
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    return searches
+
+
+def run_search(job_name, city, state, resources, autocorrect=False):
+    """
+    This function runs one search end to end: validation, scraping, the Adzuna API and loading into the database.
+    :param resources: the SharedResources to use for the network and database access.
+    :param autocorrect: whether misspelled city names are corrected (see check_validity_location).
+    :return: the number of jobs found.
+    :raises DatabaseLoadError: when loading into the database failed, so callers don't count the search as done.
+    """
+    city, state = check_validity_location(city, state, get_location_index(),
+                                          autocorrect)  # Verifying data is suitable.
     check_validity_jobname(job_name)  # checks if the job is within the list of jobs allowed.
     place = city + ", " + state
-    lat, lon = get_lat_lon(place)  # get latitude and longitude of the place being searched.
+    user, password = resources.credentials  # asked for before fetching, the sources run in other threads.
     salaries_site = monster_get_salaries(salaries_url, city, state, job_name)  # Getting salaries url.
-    prc90, med, prc10, national = get_salaries_page_data(
-        salaries_site)  # Getting salaries stats in the city and the US.
-    page = monster_get_content(monster_site, job_name, place)  # Using the function on the monster URL.
-    jobs_output = get_jobs_page_data(page)  # creating a list of all the retrieved data
-    jobs_output_api = use_adzuna_api(url_api, app_id, app_key, job_name, city)  # extracting more data from the adzuna api
-    for job in jobs_output_api:
-        jobs_output.append(job)  # concatenating the jobs outputs from the scraping and the api.
-    # loading data to tables:
-    user = input("please insert user name")
-    password = input("please insert password")
-    update_mysql_tables("localhost", user, password, 'mining',
-                        jobs_output, job_name, place, lat, lon, prc90, med, prc10, national)
+    seen_postings = resources.seen_postings
+    new_jobs = seen_postings.new_jobs if seen_postings is not None else None  # incremental runs skip known jobs.
+    # The sources don't depend on each other, so they are all fetched at the same time. The jobs of the monster
+    # listings and the adzuna api are streamed to the database as they arrive, without the duplicates across them:
+    jobs = start_sources({
+        'monster': lambda: monster_get_jobs(monster_site, job_name, place, resources.session, new_jobs),
+        'adzuna': lambda: use_adzuna_api(url_api, app_id, app_key, job_name, city,
+                                         resources.adzuna_client, new_jobs),  # more data from the adzuna api
+    }, fetch_timeouts)
+    try:
+        fetched = fetch_all({
+            'geocode': lambda: resources.geocode_cache.get(place),  # latitude and longitude of the place.
+            'salaries': lambda: get_salaries_page_data(salaries_site, resources.browser_pool, resources.session,
+                                                       resources.salary_backend),  # salaries in the city and US.
+        }, fetch_timeouts)
+        lat, lon = fetched['geocode']
+        prc90, med, prc10, national = fetched['salaries']
+        # loading data to tables:
+        dedupe_engine = DedupeEngine(fuzzy=config.getboolean('DEDUPE', 'fuzzy'),
+                                     threshold=config.getfloat('DEDUPE', 'threshold'))
+        jobs_to_load = dedupe_engine.filter(normalize(jobs))
+        pending = []  # the fingerprints of the jobs of this search.
+        if seen_postings is not None:
+            jobs_to_load = seen_postings.track(jobs_to_load, pending)
+        stats = update_mysql_tables(resources.host_name, user, password, resources.db_name,
+                                    jobs_to_load, job_name, place, lat, lon,
+                                    prc90, med, prc10, national)
+        if seen_postings is not None and stats:
+            seen_postings.commit(pending)  # only the jobs that reached the database are remembered.
+        for line in dedupe_engine.report():
+            logger.info("{} in {} dedupe - {}".format(job_name, place, line))
+    finally:
+        jobs.close()
+    if stats is None:
+        raise DatabaseLoadError("Failed to load {} in {} into the database".format(job_name, place))
+    return stats['attempted']
+
+
+def validate_batch(searches, autocorrect=False):
+    """
+    This function validates all the searches of a batch up front, so a bad line doesn't cost any fetching.
+    Invalid searches are reported with suggestions for their city and skipped.
+    :param autocorrect: whether misspelled city names are corrected instead of skipped.
+    :return: the valid searches.
+    """
+    location_index = get_location_index()
+    resolver = get_fuzzy_resolver()
+    valid = []
+    for job_name, city, state in searches:
+        hint = ""
+        if job_name.lower() not in optional_jobs:
+            hint = " (job name not acceptable)"
+        elif location_index.state_name(state) is None:
+            hint = " (not a valid state name)"
+        else:
+            if not location_index.is_valid(city, state) and autocorrect:
+                corrected = resolver.resolve(city, state)
+                if corrected is not None:
+                    print("Corrected city {} to {}.".format(city, corrected))
+                    logger.info("corrected batch city {} to {}".format(city, corrected))
+                    city = corrected
+            if location_index.is_valid(city, state):
+                valid.append((job_name, city, state))
+                continue
+            suggestions = resolver.suggest(city, state)
+            if suggestions:
+                hint = " (did you mean {}?)".format(", ".join(name for name, _ in suggestions))
+        print("Skipping invalid search: {}, {}, {}{}".format(job_name, city, state, hint))
+        error_logger.error("Invalid batch search: {}, {}, {}".format(job_name, city, state))
+    return valid
+
+
+def run_batch_search(job_name, city, state, resources):
+    """
+    This function runs one search of a batch, reporting its failure instead of raising it.
+    :return: the status of the search, the number of jobs found and the seconds it took.
+    """
+    start = time.perf_counter()
+    jobs_found = 0
+    try:
+        jobs_found = run_search(job_name, city, state, resources)
+        status = "ok"
+    except SystemExit:
+        status = "invalid input"
+    except Exception as error:
+        status = "failed"
+        error_logger.error("Search {}, {}, {} failed: {}".format(job_name, city, state, error))
+    return status, jobs_found, time.perf_counter() - start
+
+
+def batch_results(searches, record=None, replay=None, incremental=False):
+    """
+    This function runs the searches of a batch one after the other with one SharedResources.
+    :return: a generator of (job, city, state, status, jobs found, seconds, process id) tuples.
+    """
+    resources = SharedResources(record=record, replay=replay, incremental=incremental)
+    try:
+        for search in searches:
+            yield search + run_batch_search(*search, resources) + (os.getpid(),)
+    finally:
+        resources.close()
+
+
+_worker_resources = None
+
+
+def get_worker_resources(record, replay, incremental, credentials, workers):
+    """
+    This function returns the SharedResources of a worker process of a batch (its own HTTP session, browsers and
+    database connections). They are created by the first task the process runs (ProcessPoolExecutor has no
+    initializer before Python 3.7) and closed when the process exits.
+    """
+    global _worker_resources
+    if _worker_resources is None:
+        _worker_resources = SharedResources(record=record, replay=replay, incremental=incremental,
+                                            credentials=credentials, workers=workers)
+        multiprocessing.util.Finalize(None, _worker_resources.close, exitpriority=10)
+    return _worker_resources
+
+
+def run_worker_search(job_name, city, state, settings):
+    """
+    This function runs one search of a batch in a worker process.
+    :param settings: the arguments of get_worker_resources.
+    :return: the status, jobs found, seconds and process id of the search, and the fingerprints of the postings it
+    loaded for the parent to remember.
+    """
+    resources = get_worker_resources(*settings)
+    status, jobs_found, elapsed = run_batch_search(job_name, city, state, resources)
+    seen_postings = resources.seen_postings
+    return status, jobs_found, elapsed, os.getpid(), seen_postings.take_unsaved() if seen_postings else []
+
+
+def batch_results_in_workers(searches, workers, record=None, replay=None, incremental=False):
+    """
+    This function runs the searches of a batch in workers processes, each one with its own SharedResources, so the
+    parsing uses several cores. The credentials are asked for once here, and the postings the workers loaded are
+    remembered here.
+    :return: a generator of (job, city, state, status, jobs found, seconds, process id) tuples, as they finish.
+    """
+    credentials = ('', '') if replay else db_pool.get_credentials()
+    if record or replay:
+        reset_fixtures(record or replay)
+    if replay:
+        migrate_replay_database(replay)  # the workers would race to create the same indexes.
+    seen_postings = create_seen_postings(record or replay) if incremental else None
+    settings = (record, replay, incremental, credentials, workers)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(run_worker_search, *search, settings): search for search in searches}
+        for future in as_completed(futures):
+            status, jobs_found, elapsed, worker, fingerprints = future.result()
+            if seen_postings is not None and fingerprints:
+                seen_postings.commit(fingerprints)
+            yield futures[future] + (status, jobs_found, elapsed, worker)
+
+
+def run_batch(path, autocorrect=False, record=None, replay=None, incremental=False, workers=1):
+    """
+    This function runs all the searches of a batch file, in one process sharing the browser, HTTP session, geocoder
+    and database connection, or in workers processes, and reports the timing of every search and the overall
+    throughput.
+    :param path: the path of the batch file, "-" reads from stdin.
+    :param autocorrect: whether misspelled city names are corrected instead of skipped.
+    :param record: an optional fixture directory to save the responses to (see SharedResources).
+    :param replay: an optional fixture directory to replay the responses of.
+    :param incremental: whether the postings loaded by former runs are skipped.
+    :param workers: the number of processes running the searches.
+    """
+    searches = validate_batch(read_batch_file(path), autocorrect)
+    succeeded = 0
+    jobs_found = 0
+    busy = {}  # the number of searches and seconds spent of every process.
+    batch_start = time.perf_counter()
+    if workers > 1:
+        results = batch_results_in_workers(searches, workers, record, replay, incremental)
+    else:
+        results = batch_results(searches, record, replay, incremental)
+    for job_name, city, state, status, search_jobs, elapsed, worker in results:
+        if status == "ok":
+            succeeded += 1
+            jobs_found += search_jobs
+        worker_searches, worker_seconds = busy.get(worker, (0, 0))
+        busy[worker] = (worker_searches + 1, worker_seconds + elapsed)
+        print("{}, {}, {}: {} in {:.2f}s".format(job_name, city, state, status, elapsed))
+        logger.info("batch search {}, {}, {}: {} in {:.2f}s (process {})".format(job_name, city, state, status,
+                                                                               elapsed, worker))
+    total = time.perf_counter() - batch_start
+    summary = ("Batch done: {} of {} searches succeeded, {} jobs in {:.2f}s "
+               "({:.2f} searches/min, {:.2f} jobs/s).".format(succeeded, len(searches), jobs_found, total,
+                                                              60 * len(searches) / total if total else 0,
+                                                              jobs_found / total if total else 0))
+    print(summary)
+    logger.info(summary)
+    if workers > 1:
+        for worker, (worker_searches, worker_seconds) in sorted(busy.items()):
+            logger.info("process {}: {} searches, busy {:.0%} of the time".format(
+                worker, worker_searches, worker_seconds / total if total else 0))
+        print("{} processes, {:.0%} busy on average.".format(
+            workers, sum(seconds for _, seconds in busy.values()) / (workers * total) if total else 0))
+
+
+def refresh_searches(states=None):
+    """
+    This function returns all the (job, city, state) searches the scheduler keeps fresh: every job of optional_jobs
+    in every city, or only the cities of the states listed in the [SCHEDULER] section.
+    :param states: comma separated states to use instead of the ones of the [SCHEDULER] section.
+    """
+    location_index = get_location_index()
+    if states is None:
+        states = config['SCHEDULER']['states']
+    states = {location_index.state_name(state) for state in states.split(',') if state.strip()}
+    return [(job.strip().title(), city, state) for job in optional_jobs
+            for city, state in load_city_states() if not states or state in states]
+
+
+def run_scheduler(incremental=False, max_runs=None):
+    """
+    This function refreshes the searches of refresh_searches in one long running process (see RefreshScheduler),
+    with the concurrency, rate and intervals of the [SCHEDULER] section of the config, until it is interrupted.
+    :param incremental: whether the postings loaded by former runs are skipped.
+    :param max_runs: an optional number of searches to stop after.
+    """
+    scheduler_config = config['SCHEDULER']
+    resources = SharedResources(incremental=incremental)
+    resources.credentials  # asked for once, before the searches start in other threads.
+    scheduler = RefreshScheduler(lambda job, city, state: run_search(job, city, state, resources),
+                                 refresh_searches(), scheduler_config['state_path'],
+                                 concurrency=scheduler_config.getint('concurrency'),
+                                 rate_limiter=TokenBucket(scheduler_config.getfloat('searches_per_minute') / 60,
+                                                          scheduler_config.getint('burst')),
+                                 base_interval=scheduler_config.getfloat('base_interval_hours') * 3600,
+                                 min_interval=scheduler_config.getfloat('min_interval_hours') * 3600,
+                                 max_interval=scheduler_config.getfloat('max_interval_days') * 24 * 3600,
+                                 churn_weight=scheduler_config.getfloat('churn_weight'))
+    runs = 0
+    try:
+        runs = scheduler.run(max_runs)
+    except KeyboardInterrupt:
+        print("Scheduler stopped.")
+    finally:
+        scheduler.close()
+        resources.close()
+    logger.info("scheduler stopped after {} searches".format(runs))
+
+
+def create_work_queue(connect):
+    """
+    This function creates a WorkQueue with the settings of the [QUEUE] section of the config.
+    """
+    return WorkQueue(connect, lease_seconds=config.getint('QUEUE', 'lease_seconds'),
+                     max_attempts=config.getint('QUEUE', 'max_attempts'))
+
+
+def connect_to_queue(credentials):
+    """
+    This function returns a callable that checks a connection to the database of the work queue out of the pool.
+    """
+    return lambda: db_pool.get_connection(db_pool.mysql_config.get('host', 'localhost'), *credentials,
+                                          db_pool.mysql_config.get('database', 'mining'))
+
+
+def enqueue_searches(batch=None, states=None, autocorrect=False):
+    """
+    This function is the producer of the work queue: it creates the work_queue table if needed and adds the searches
+    of a batch file, or every job of optional_jobs in every city (of states).
+    """
+    if batch:
+        searches = validate_batch(read_batch_file(batch), autocorrect)
+    else:
+        searches = refresh_searches(states or "")
+    queue = create_work_queue(connect_to_queue(db_pool.get_credentials()))
+    queue.create_table()
+    print("Enqueued {} searches.".format(queue.enqueue(searches)))
+
+
+def print_queue_status():
+    """
+    This function prints the number of tasks of every status in the work queue.
+    """
+    counts = create_work_queue(connect_to_queue(db_pool.get_credentials())).counts()
+    for status in ('pending', 'claimed', 'done', 'failed'):
+        print("{}: {}".format(status, counts.get(status, 0)))
+
+
+def retry_on_lock_errors(operation, *args, attempts=5, backoff=0.1):
+    """
+    This function runs a work queue operation, and runs it again after a short backoff (doubled every time) when
+    MySQL ended it with a deadlock or a lock wait timeout, which concurrent workers can cause.
+    """
+    import mysql.connector
+    from mysql.connector import errorcode
+    for attempt in range(attempts):
+        try:
+            return operation(*args)
+        except mysql.connector.Error as error:
+            lock_error = error.errno in (errorcode.ER_LOCK_DEADLOCK, errorcode.ER_LOCK_WAIT_TIMEOUT)
+            if not lock_error or attempt == attempts - 1:
+                raise
+            delay = backoff * 2 ** attempt
+            logger.info("work queue {} failed ({}), retrying in {}s".format(operation.__name__, error, delay))
+            time.sleep(delay)
+
+
+def drain_queue(resources, max_tasks=None):
+    """
+    This function is a worker of the work queue: it claims searches and runs them with the pipeline of run_search
+    until the queue is empty (or, with poll_seconds in the [QUEUE] section, waits for more), or max_tasks ran.
+    :return: the number of searches that ran and the number of jobs they found.
+    """
+    queue = create_work_queue(resources.connect)
+    poll_seconds = config.getfloat('QUEUE', 'poll_seconds')
+    tasks = 0
+    jobs_found = 0
+    while max_tasks is None or tasks < max_tasks:
+        task = retry_on_lock_errors(queue.claim)
+        if task is None:
+            if not poll_seconds:
+                break
+            time.sleep(poll_seconds)
+            continue
+        with queue.lease(task):
+            status, search_jobs, elapsed = run_batch_search(task.job_name, task.city, task.state, resources)
+        if status == "ok":
+            retry_on_lock_errors(queue.complete, task, search_jobs)
+            jobs_found += search_jobs
+        else:
+            retry_on_lock_errors(queue.fail, task, status, status != "invalid input")
+        tasks += 1
+        print("{}, {}, {}: {} in {:.2f}s".format(task.job_name, task.city, task.state, status, elapsed))
+    return tasks, jobs_found
+
+
+def drain_queue_in_worker(settings, max_tasks=None):
+    """
+    This function drains the work queue in a worker process.
+    :param settings: the arguments of get_worker_resources.
+    :return: the number of searches and jobs, and the fingerprints of the postings loaded for the parent to remember.
+    """
+    resources = get_worker_resources(*settings)
+    tasks, jobs_found = drain_queue(resources, max_tasks)
+    seen_postings = resources.seen_postings
+    return tasks, jobs_found, seen_postings.take_unsaved() if seen_postings else []
+
+
+def run_queue_workers(workers=1, incremental=False, max_tasks=None):
+    """
+    This function drains the work queue in this process, or in workers processes. Several hosts can run it on the
+    same queue at the same time.
+    :param max_tasks: an optional number of searches every process stops after.
+    """
+    start = time.perf_counter()
+    if workers > 1:
+        credentials = db_pool.get_credentials()
+        seen_postings = create_seen_postings() if incremental else None
+        settings = (None, None, incremental, credentials, workers)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = [future.result() for future in
+                       [executor.submit(drain_queue_in_worker, settings, max_tasks) for _ in range(workers)]]
+        for _, _, fingerprints in results:
+            if seen_postings is not None and fingerprints:
+                seen_postings.commit(fingerprints)
+        tasks = sum(result[0] for result in results)
+        jobs_found = sum(result[1] for result in results)
+    else:
+        resources = SharedResources(incremental=incremental)
+        try:
+            tasks, jobs_found = drain_queue(resources, max_tasks)
+        finally:
+            resources.close()
+    summary = "Worker done: {} searches, {} jobs in {:.2f}s.".format(tasks, jobs_found, time.perf_counter() - start)
+    print(summary)
+    logger.info(summary)
+
+
+def main():
+    arguments = get_arguments()
+    if arguments.enqueue:
+        enqueue_searches(arguments.batch, arguments.states, arguments.autocorrect)
+        return
+    if arguments.queue_status:
+        print_queue_status()
+        return
+    if arguments.worker:
+        run_queue_workers(arguments.workers, arguments.incremental, arguments.max_runs)
+        return
+    if arguments.schedule:
+        run_scheduler(arguments.incremental, arguments.max_runs)
+        return
+    if arguments.batch:
+        run_batch(arguments.batch, arguments.autocorrect, arguments.record, arguments.replay, arguments.incremental,
+                  arguments.workers)
+        return
+    job_name, city, state = get_parameters(arguments)  # gets the parameters from the CLI.
+    resources = SharedResources(record=arguments.record, replay=arguments.replay, incremental=arguments.incremental)
+    try:
+        run_search(job_name, city, state, resources, arguments.autocorrect)
+    except DatabaseLoadError:
+        sys.exit(1)
+    finally:
+        resources.close()
 
 
 if __name__ == '__main__':
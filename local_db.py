@@ -0,0 +1,109 @@
+import re
+import sqlite3
+import threading
+from mysql.connector import Error
+
+# the tables of mining_database_connection.py in the sqlite dialect
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS titles (
+  title_id INTEGER PRIMARY KEY AUTOINCREMENT,
+  title VARCHAR(20) UNIQUE);
+CREATE TABLE IF NOT EXISTS location (
+  location_id INTEGER PRIMARY KEY AUTOINCREMENT,
+  location_name VARCHAR(50) NOT NULL UNIQUE,
+  latitude DECIMAL(9,6),
+  longitude DECIMAL(9,6));
+CREATE TABLE IF NOT EXISTS national_salaries (
+  national_salary_id INTEGER PRIMARY KEY AUTOINCREMENT,
+  title_id INTEGER UNIQUE NOT NULL REFERENCES titles(title_id),
+  national_median_salary INT);
+CREATE TABLE IF NOT EXISTS regional_salaries (
+  regional_salary_id INTEGER PRIMARY KEY AUTOINCREMENT,
+  title_id INTEGER REFERENCES titles(title_id),
+  location_id INTEGER REFERENCES location(location_id),
+  area_median_salary INT,
+  area_ninety_salary INT,
+  area_tenth_salary INT,
+  UNIQUE (title_id, location_id));
+CREATE TABLE IF NOT EXISTS open_positions (
+  open_position_id INTEGER PRIMARY KEY AUTOINCREMENT,
+  title_id INTEGER REFERENCES titles(title_id),
+  location_id INTEGER REFERENCES location(location_id),
+  job_description VARCHAR(40),
+  company_name VARCHAR(20) NOT NULL,
+  date_posted DATETIME,
+  UNIQUE (title_id, location_id, job_description, company_name));
+"""
+
+
+def translate(query):
+    """
+    This function rewrites the MySQL specific parts of the queries of this project for sqlite: INSERT IGNORE and
+    the %s placeholders.
+    """
+    query = re.sub(r"\bINSERT\s+IGNORE\b", "INSERT OR IGNORE", query, flags=re.IGNORECASE)
+    return query.replace("%s", "?")
+
+
+class LocalCursor:
+    """
+    A cursor of a LocalConnection with the parts of the mysql.connector cursor interface this project uses. Like
+    MySQL, lastrowid is 0 when an INSERT IGNORE inserted nothing.
+    """
+
+    def __init__(self, connection):
+        self._connection = connection
+        self._cursor = connection.raw.cursor()
+        self.lastrowid = 0
+        self.rowcount = -1
+
+    def execute(self, query, params=()):
+        try:
+            with self._connection.lock:
+                self._cursor.execute(translate(query), tuple(params or ()))
+        except sqlite3.Error as error:
+            raise Error(msg=str(error))
+        self.rowcount = self._cursor.rowcount
+        self.lastrowid = self._cursor.lastrowid if self.rowcount > 0 else 0
+
+    def fetchone(self):
+        return self._cursor.fetchone()
+
+    def fetchall(self):
+        return self._cursor.fetchall()
+
+    def close(self):
+        self._cursor.close()
+
+
+class LocalConnection:
+    """
+    A sqlite database standing in for the MySQL server, so the whole pipeline can run on a machine without one. It
+    has the parts of the mysql.connector connection interface this project uses.
+    """
+
+    def __init__(self, path):
+        self.raw = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        self.raw.executescript(SCHEMA)
+        self.raw.commit()
+
+    def cursor(self):
+        return LocalCursor(self)
+
+    def commit(self):
+        with self.lock:
+            self.raw.commit()
+
+    def rollback(self):
+        with self.lock:
+            self.raw.rollback()
+
+    def is_connected(self):
+        return True
+
+    def ping(self, reconnect=False, attempts=1, delay=0):
+        pass
+
+    def close(self):
+        self.raw.close()
@@ -0,0 +1,82 @@
+from bisect import bisect_left
+from city_state import load_city_states, states_abb, states_long
+
+
+class LocationIndex:
+    """
+    An index of the US cities and states, built once. A city name maps to the set of states that have a city with
+    that name, and state abbreviations and names map to the full state name. All the lookups are case-insensitive.
+    """
+
+    def __init__(self, city_states, states_abb, states_long):
+        """
+        :param city_states: an iterable of (city, full state name) pairs.
+        """
+        self.state_names = {}
+        for abb, name in zip(states_abb, states_long):
+            self.state_names[abb.lower()] = name
+            self.state_names[name.lower()] = name
+        self.city_names = {}
+        self.states_by_city = {}
+        for city, state in city_states:
+            key = city.lower()
+            self.city_names.setdefault(key, city)
+            self.states_by_city.setdefault(key, set()).add(state)
+        self.sorted_cities = sorted(self.city_names)
+
+    def state_name(self, state):
+        """
+        This function returns the full name of a state given its name or abbreviation, None if it isn't a state.
+        """
+        return self.state_names.get(state.strip().lower())
+
+    def city_name(self, city):
+        """
+        This function returns the name of a city as it appears in the data, None if it isn't a known city.
+        """
+        return self.city_names.get(city.strip().lower())
+
+    def states_of(self, city):
+        """
+        This function returns the set of full state names that have a city with this name.
+        """
+        return self.states_by_city.get(city.strip().lower(), set())
+
+    def is_valid(self, city, state):
+        """
+        This function checks that a city exists in a state (given by name or abbreviation).
+        """
+        return self.state_name(state) in self.states_of(city)
+
+    def cities_with_prefix(self, prefix, limit=10):
+        """
+        This function returns up to limit city names that start with prefix, in alphabetical order.
+        """
+        prefix = prefix.strip().lower()
+        cities = []
+        for key in self.sorted_cities[bisect_left(self.sorted_cities, prefix):]:
+            if not key.startswith(prefix) or len(cities) == limit:
+                break
+            cities.append(self.city_names[key])
+        return cities
+
+    def city_states(self):
+        """
+        Yields all the (city, full state name) pairs.
+        """
+        for key in self.sorted_cities:
+            for state in sorted(self.states_by_city[key]):
+                yield self.city_names[key], state
+
+
+_location_index = None
+
+
+def get_location_index():
+    """
+    This function returns the LocationIndex of all the main cities in the US, built on the first call.
+    """
+    global _location_index
+    if _location_index is None:
+        _location_index = LocationIndex(load_city_states(), states_abb, states_long)
+    return _location_index
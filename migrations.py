@@ -0,0 +1,60 @@
+import logging
+
+logger = logging.getLogger('info_logger')
+
+create_schema_migrations_table = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+  name VARCHAR(100) NOT NULL PRIMARY KEY,
+  applied_at DATETIME DEFAULT CURRENT_TIMESTAMP
+  );
+ """
+
+# The changes of the schema of mining_database_connection.py, applied in order and once. The open_positions indexes
+# cover the hot reads of position_queries.py: they hold every column those queries select, so the reads never go
+# back to the table rows.
+MIGRATIONS = [
+    ('001_open_positions_date', """
+CREATE INDEX idx_open_positions_date
+  ON open_positions (date_posted, company_name, job_description, title_id, location_id)
+ """),
+    ('002_open_positions_company', """
+CREATE INDEX idx_open_positions_company
+  ON open_positions (company_name, date_posted, job_description, title_id, location_id)
+ """),
+    ('003_open_positions_title_location_date', """
+CREATE INDEX idx_open_positions_title_location_date
+  ON open_positions (title_id, location_id, date_posted, company_name, job_description)
+ """),
+]
+
+
+def applied_migrations(cursor):
+    """
+    This function returns the names of the migrations already applied to a database.
+    """
+    cursor.execute(create_schema_migrations_table)
+    cursor.execute("""SELECT name FROM schema_migrations""")
+    return {row[0] for row in cursor.fetchall()}
+
+
+def migrate(connection):
+    """
+    This function applies the migrations a database doesn't have yet, each one committed with its record in
+    schema_migrations. Works on MySQL and on the local sqlite database of local_db.py.
+    :return: the names of the migrations applied.
+    """
+    cursor = connection.cursor()
+    try:
+        done = applied_migrations(cursor)
+        applied = []
+        for name, statement in MIGRATIONS:
+            if name in done:
+                continue
+            cursor.execute(statement)
+            cursor.execute("""INSERT INTO schema_migrations (name) VALUES (%s)""", (name,))
+            connection.commit()
+            applied.append(name)
+            logger.info("applied migration {}".format(name))
+        return applied
+    finally:
+        cursor.close()
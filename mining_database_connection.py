@@ -1,16 +1,13 @@
-import mysql.connector
 from mysql.connector import Error
+from db_pool import get_connection, get_credentials, mysql_config
+from work_queue import create_work_queue_table
+from migrations import migrate
 
 
 def create_db_connection(host_name, user_name, user_password, db_name):
     connection = None
     try:
-        connection = mysql.connector.connect(
-            host=host_name,
-            user=user_name,
-            passwd=user_password,
-            database=db_name
-        )
+        connection = get_connection(host_name, user_name, user_password, db_name)
         print("MySQL Database connection successful")
     except Error as err:
         print(f"Error: '{err}'")
@@ -107,11 +104,23 @@ create_unique_job_positions ="""
 ALTER TABLE open_positions ADD UNIQUE KEY (title_id,location_id, job_description, company_name)
 """
 
-connection = create_db_connection("localhost", "root", '1234', 'mining')  # Connect to the Database
-execute_query(connection, create_titles_table)  # Execute defined query
-execute_query(connection, create_location_table)
-execute_query(connection, create_national_salaries_table)
-execute_query(connection, create_regional_job_salaries_table)
-execute_query(connection, create_open_positions_table)
-execute_query(connection, create_unique_regional)
-execute_query(connection, create_unique_job_positions)
+schema_queries = [create_titles_table, create_location_table, create_national_salaries_table,
+                  create_regional_job_salaries_table, create_open_positions_table, create_unique_regional,
+                  create_unique_job_positions, create_work_queue_table]
+
+
+def create_tables(connection):
+    """
+    This function creates the tables of the mining database, then applies the migrations (the indexes of
+    migrations.py).
+    """
+    for query in schema_queries:
+        execute_query(connection, query)  # Execute defined query
+    applied = migrate(connection)
+    print("Applied migrations: {}".format(", ".join(applied) if applied else "none"))
+
+
+if __name__ == '__main__':
+    connection = create_db_connection(mysql_config.get('host', 'localhost'), *get_credentials(),
+                                      mysql_config.get('database', 'mining'))  # Connect to the Database
+    create_tables(connection)
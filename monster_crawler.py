@@ -0,0 +1,37 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger('info_logger')
+
+
+def crawl_pages(fetch_page, parse_page, max_pages=10, concurrency=4, new_jobs=None):
+    """
+    This function fetches the result pages of a search concurrently, concurrency pages at a time, and stops at the
+    first page without results. Cards that appear on several pages are only kept once.
+    :param fetch_page: a callable that gets a page number (starting at 1) and returns the page.
+    :param parse_page: a callable that gets a page and returns the list of jobs on it.
+    :param max_pages: the maximal number of pages fetched.
+    :param concurrency: the maximal number of pages fetched at the same time.
+    :param new_jobs: an optional callable that gets the jobs of a page and returns the ones not seen in former runs
+    (incremental crawling). Known jobs are dropped but the crawl goes on, as the pages aren't ordered by date.
+    :return: a generator of the jobs of all the pages, in page order, yielding the jobs of each page as soon as it
+    arrives.
+    """
+    jobs_found = 0
+    seen = set()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for first in range(1, max_pages + 1, concurrency):
+            numbers = range(first, min(first + concurrency, max_pages + 1))
+            pages = executor.map(lambda number: parse_page(fetch_page(number)), numbers)
+            for number, jobs in zip(numbers, pages):
+                if not jobs:
+                    logger.info("page {} is empty, stopped after {} jobs".format(number, jobs_found))
+                    return
+                if new_jobs is not None:
+                    jobs = new_jobs(jobs)
+                for job in jobs:
+                    key = job.key
+                    if key not in seen:
+                        seen.add(key)
+                        jobs_found += 1
+                        yield job
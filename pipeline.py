@@ -0,0 +1,120 @@
+import queue
+import threading
+import time
+from fetch_orchestrator import FetchTimeoutError
+from job_posting import JobPosting
+
+_DONE = object()
+
+
+class _SourceError:
+    def __init__(self, name, error):
+        self.name = name
+        self.error = error
+
+
+class SourceStream:
+    """
+    The records of sources running in threads. Iterating it yields the records, closing it (also done when the
+    iteration ends) stops the sources.
+    """
+
+    def __init__(self, records, stop, buffer):
+        self._records = records
+        self._stop = stop
+        self._buffer = buffer
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._records)
+
+    def release(self):
+        """
+        Stops the sources, and unblocks the ones waiting for room in the buffer so their threads can end.
+        """
+        self._stop.set()
+        while True:
+            try:
+                self._buffer.get_nowait()
+            except queue.Empty:
+                break
+
+    def close(self):
+        self.release()
+        self._records.close()
+
+
+def start_sources(sources, timeouts=None, default_timeout=60, buffer_size=1000):
+    """
+    This function starts every source in its own thread right away, and returns a SourceStream of the records of
+    all of them in the order they arrive. The records go through a bounded buffer, so a source that is ahead of the
+    consumer waits instead of piling up records in memory.
+    :param sources: a dictionary of source name to a callable without arguments that returns an iterable of records.
+    :param timeouts: a dictionary of source name to the number of seconds that source is allowed to take.
+    :param default_timeout: the timeout of sources that are missing from timeouts.
+    :param buffer_size: the maximal number of records waiting to be consumed.
+    Iterating raises FetchTimeoutError if a source is too slow, or the exception of a source that failed.
+    """
+    timeouts = timeouts or {}
+    buffer = queue.Queue(maxsize=buffer_size)
+    stop = threading.Event()
+
+    def produce(name, source):
+        try:
+            for record in source():
+                if stop.is_set():
+                    return
+                buffer.put((name, record))
+            buffer.put((name, _DONE))
+        except Exception as error:
+            buffer.put((name, _SourceError(name, error)))
+
+    start = time.perf_counter()
+    for name, source in sources.items():
+        threading.Thread(target=produce, args=(name, source), daemon=True).start()
+
+    def records():
+        deadlines = {name: start + timeouts.get(name, default_timeout) for name in sources}
+        try:
+            while deadlines:
+                name = min(deadlines, key=deadlines.get)
+                try:
+                    source_name, record = buffer.get(timeout=max(deadlines[name] - time.perf_counter(), 0))
+                except queue.Empty:
+                    raise FetchTimeoutError("{} did not respond within {} seconds".format(
+                        name, timeouts.get(name, default_timeout)))
+                if record is _DONE:
+                    del deadlines[source_name]
+                elif isinstance(record, _SourceError):
+                    raise record.error
+                else:
+                    yield record
+        finally:
+            stream.release()
+
+    stream = SourceStream(records(), stop, buffer)
+    return stream
+
+
+def normalize(records):
+    """
+    This function strips the white space around the fields of the JobPosting records.
+    """
+    for record in records:
+        yield JobPosting(*(field.strip() if isinstance(field, str) else field for field in record))
+
+
+def batched(records, size):
+    """
+    This function groups the records into lists of up to size records.
+    """
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
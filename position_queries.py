@@ -0,0 +1,132 @@
+import argparse
+import sys
+import db_pool
+from migrations import migrate
+
+RECENT_POSITIONS = """SELECT title_id, location_id, job_description, company_name, date_posted
+                      FROM open_positions
+                      WHERE date_posted >= %s
+                      ORDER BY date_posted DESC
+                      LIMIT %s"""
+
+COMPANY_POSITIONS = """SELECT title_id, location_id, job_description, company_name, date_posted
+                       FROM open_positions
+                       WHERE company_name = %s
+                       ORDER BY date_posted DESC
+                       LIMIT %s"""
+
+TITLE_LOCATION_POSITIONS = """SELECT job_description, company_name, date_posted
+                              FROM open_positions
+                              WHERE title_id = (SELECT title_id FROM titles WHERE title = %s)
+                                AND location_id = (SELECT location_id FROM location WHERE location_name = %s)
+                                AND date_posted BETWEEN %s AND %s
+                              ORDER BY date_posted"""
+
+# the hot queries, with sample parameters and the index each one must use (see migrations.py).
+HOT_QUERIES = {
+    'recent_positions': (RECENT_POSITIONS, ('2020-01-01', 100), 'idx_open_positions_date'),
+    'company_positions': (COMPANY_POSITIONS, ('Amazon', 100), 'idx_open_positions_company'),
+    'title_location_positions': (TITLE_LOCATION_POSITIONS,
+                                 ('Data Scientist', 'Boston, Massachusetts', '2020-01-01', '2020-12-31'),
+                                 'idx_open_positions_title_location_date'),
+}
+
+
+def recent_positions(cursor, since, limit=100):
+    """
+    This function returns the newest open positions posted since a date.
+    :return: a list of (title_id, location_id, job description, company, date posted) rows, newest first.
+    """
+    cursor.execute(RECENT_POSITIONS, (since, limit))
+    return cursor.fetchall()
+
+
+def company_positions(cursor, company_name, limit=100):
+    """
+    This function returns the newest open positions of a company.
+    :return: a list of (title_id, location_id, job description, company, date posted) rows, newest first.
+    """
+    cursor.execute(COMPANY_POSITIONS, (company_name, limit))
+    return cursor.fetchall()
+
+
+def title_location_positions(cursor, title, location_name, start, end):
+    """
+    This function returns the open positions of a job title in a location (as "city, state") posted between two
+    dates.
+    :return: a list of (job description, company, date posted) rows, oldest first.
+    """
+    cursor.execute(TITLE_LOCATION_POSITIONS, (title, location_name, start, end))
+    return cursor.fetchall()
+
+
+def explain(cursor, query, params):
+    """
+    This function returns the MySQL plan of a query, a dict per table access.
+    """
+    cursor.execute("EXPLAIN " + query, params)
+    columns = [column[0] for column in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def plan_problems(plan, index):
+    """
+    This function returns what is wrong with the open_positions accesses of a query plan: a full table scan, another
+    index than index, a sort, or reads of the table rows (the index doesn't cover the query).
+    """
+    problems = []
+    for step in plan:
+        if step.get('table') != 'open_positions':
+            continue
+        extra = [item.strip() for item in (step.get('Extra') or '').split(';')]
+        if step.get('type') == 'ALL':
+            problems.append("full table scan")
+        if step.get('key') != index:
+            problems.append("uses index {} instead of {}".format(step.get('key'), index))
+        if 'Using filesort' in extra:
+            problems.append("sorts the rows")
+        if 'Using index' not in extra:  # "Using index condition" still reads the rows.
+            problems.append("reads the table rows")
+    if not any(step.get('table') == 'open_positions' for step in plan):
+        problems.append("no open_positions access in the plan")
+    return problems
+
+
+def check_query_plans(cursor):
+    """
+    This function EXPLAINs the hot queries. The plans depend on the statistics of the tables, so check them on a
+    database with a realistic amount of rows: on an almost empty table MySQL may rightly prefer a scan.
+    :return: a dict of query name to the list of its plan problems, empty when the plan is fine.
+    """
+    return {name: plan_problems(explain(cursor, query, params), index)
+            for name, (query, params, index) in HOT_QUERIES.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrates the mining database and checks the plans of the hot "
+                                                 "queries on open_positions.")
+    parser.add_argument('--migrate', action='store_true', help='apply the migrations not applied yet.')
+    parser.add_argument('--check', action='store_true',
+                        help='EXPLAIN the hot queries and exit with status 1 if one of them scans, sorts or misses '
+                             'its index.')
+    arguments = parser.parse_args()
+    connection = db_pool.get_connection(None, *db_pool.get_credentials(),
+                                        db_pool.mysql_config.get('database', 'mining'))
+    try:
+        if arguments.migrate:
+            applied = migrate(connection)
+            print("Applied migrations: {}".format(", ".join(applied) if applied else "none"))
+        if arguments.check:
+            cursor = connection.cursor()
+            problems = check_query_plans(cursor)
+            cursor.close()
+            for name, query_problems in problems.items():
+                print("{}: {}".format(name, "; ".join(query_problems) if query_problems else "ok"))
+            if any(problems.values()):
+                sys.exit(1)
+    finally:
+        connection.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+import heapq
+import logging
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+logger = logging.getLogger('info_logger')
+error_logger = logging.getLogger('error_logger')
+
+HOUR = 3600
+
+
+class RefreshScheduler:
+    """
+    Keeps refreshing (job, city, state) searches, the stalest first. Every search is due interval seconds after its
+    last run, and the interval shrinks with the churn of the search: a moving average of how much its posting count
+    changed from run to run, relative to the count. Busy searches are refreshed every few min_interval, searches that
+    don't change drift towards max_interval, and failed ones are retried later and later. The searches run in up to
+    concurrency threads and take a token from rate_limiter each, and their last run, count and churn are kept in a
+    sqlite file so the schedule survives restarts.
+    """
+
+    def __init__(self, refresh, searches, state_path, concurrency=2, rate_limiter=None, base_interval=24 * HOUR,
+                 min_interval=6 * HOUR, max_interval=30 * 24 * HOUR, churn_weight=4.0, smoothing=0.5):
+        """
+        :param refresh: a callable that runs a search given the job, city and state, and returns its posting count.
+        :param searches: an iterable of (job, city, state) searches to keep fresh.
+        :param state_path: the path of the sqlite file of the schedule.
+        :param concurrency: the maximal number of searches running at the same time.
+        :param rate_limiter: an optional TokenBucket limiting the searches started per second.
+        :param base_interval: the seconds between two runs of a search without churn.
+        :param min_interval: the shortest interval, and the delay of the first retry of a failed search.
+        :param max_interval: the longest interval.
+        :param churn_weight: how much the churn shortens the interval, the interval is base_interval / (1 +
+        churn_weight * churn).
+        :param smoothing: the weight of the last change in the churn moving average.
+        """
+        self.refresh = refresh
+        self.concurrency = concurrency
+        self.rate_limiter = rate_limiter
+        self.base_interval = base_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.churn_weight = churn_weight
+        self.smoothing = smoothing
+        self._store = sqlite3.connect(state_path)
+        self._store.execute("""CREATE TABLE IF NOT EXISTS refresh_state (
+                                 job TEXT,
+                                 city TEXT,
+                                 state TEXT,
+                                 last_run REAL,
+                                 last_count INTEGER,
+                                 churn REAL,
+                                 failures INTEGER,
+                                 PRIMARY KEY (job, city, state))""")
+        self._store.commit()
+        self.state = {}
+        for job, city, state, last_run, last_count, churn, failures in self._store.execute(
+                """SELECT job, city, state, last_run, last_count, churn, failures FROM refresh_state"""):
+            self.state[(job, city, state)] = {'last_run': last_run, 'last_count': last_count, 'churn': churn,
+                                              'failures': failures}
+        # the queue of (due time, search), searches that never ran are due first.
+        self.queue = []
+        for search in dict.fromkeys(searches):
+            entry = self.state.get(search)
+            heapq.heappush(self.queue, (0 if entry is None else self.due(entry), search))
+
+    def interval(self, churn, failures=0):
+        """
+        This function returns the seconds until the next run of a search with this churn and number of failures.
+        """
+        if failures:
+            return min(self.max_interval, self.min_interval * 2 ** (failures - 1))
+        interval = self.base_interval / (1 + self.churn_weight * churn)
+        return min(self.max_interval, max(self.min_interval, interval))
+
+    def due(self, entry):
+        return entry['last_run'] + self.interval(entry['churn'], entry['failures'])
+
+    def record(self, search, count, finished_at):
+        """
+        This function updates the churn of a search after a run (count None when it failed), saves it and queues the
+        search again.
+        """
+        entry = self.state.get(search, {'last_run': 0, 'last_count': None, 'churn': 1.0, 'failures': 0})
+        if count is None:
+            entry['failures'] += 1
+        else:
+            if entry['last_count'] is not None:
+                change = abs(count - entry['last_count']) / max(entry['last_count'], 1)
+                entry['churn'] = self.smoothing * change + (1 - self.smoothing) * entry['churn']
+            entry['last_count'] = count
+            entry['failures'] = 0
+        entry['last_run'] = finished_at
+        self.state[search] = entry
+        self._store.execute("""INSERT OR REPLACE INTO refresh_state
+                               (job, city, state, last_run, last_count, churn, failures)
+                               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                            search + (entry['last_run'], entry['last_count'], entry['churn'], entry['failures']))
+        self._store.commit()
+        heapq.heappush(self.queue, (self.due(entry), search))
+        return entry
+
+    def _run_one(self, search):
+        try:
+            return self.refresh(*search)
+        except SystemExit:
+            error_logger.error("Refresh of {}, {}, {} was rejected".format(*search))
+        except Exception as error:
+            error_logger.error("Refresh of {}, {}, {} failed: {}".format(*search, error))
+        return None
+
+    def run(self, max_runs=None, stop=None):
+        """
+        This function runs the due searches until max_runs searches ran, stop (a threading.Event) is set or the
+        process is interrupted, and waits for the running searches before returning.
+        :return: the number of searches that ran.
+        """
+        runs = 0
+        running = {}
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            try:
+                while (max_runs is None or runs < max_runs) and not (stop is not None and stop.is_set()):
+                    delay = self.queue[0][0] - time.time() if self.queue else 60
+                    if len(running) >= self.concurrency or delay > 0:
+                        timeout = 60 if len(running) >= self.concurrency else min(delay, 60)
+                        if running:
+                            done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+                            self._collect(running, done)
+                        else:
+                            time.sleep(min(delay, 60))
+                        continue
+                    _, search = heapq.heappop(self.queue)
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.acquire()
+                    logger.info("refreshing {}, {}, {}".format(*search))
+                    running[executor.submit(self._run_one, search)] = search
+                    runs += 1
+            finally:
+                self._collect(running, wait(running).done)
+        return runs
+
+    def _collect(self, running, done):
+        for future in done:
+            search = running.pop(future)
+            entry = self.record(search, future.result(), time.time())
+            logger.info("refreshed {}, {}, {}: {} postings, churn {:.2f}, next in {:.1f}h".format(
+                *search, entry['last_count'], entry['churn'], (self.due(entry) - time.time()) / HOUR))
+
+    def close(self):
+        self._store.close()
@@ -0,0 +1,94 @@
+import json
+import re
+from bs4 import BeautifulSoup
+
+# The names of the salary values, both in the data embedded in the page scripts and as the classes of the spans that
+# display them once the page is rendered.
+SALARY_KEYS = {'prc90': 'maxSalary', 'med': 'avgSalary', 'prc10': 'minSalary', 'national': 'nationalSalary'}
+
+
+class SalaryDataNotFound(Exception):
+    """
+    Raised when a salaries page doesn't contain the salaries data.
+    """
+
+
+def to_salary(value):
+    """
+    This function converts a salary as it appears in the page ("85,000", "85000.0" or 85000) to an int.
+    """
+    return int(float(str(value).replace(",", "").replace("$", "").strip()))
+
+
+def find_keys(payload, keys, found):
+    """
+    This function walks a decoded JSON payload and collects the first value of each of the keys into found.
+    """
+    if isinstance(payload, dict):
+        for key, value in payload.items():
+            if key in keys and key not in found and not isinstance(value, (dict, list)):
+                found[key] = value
+            else:
+                find_keys(value, keys, found)
+    elif isinstance(payload, list):
+        for value in payload:
+            find_keys(value, keys, found)
+    return found
+
+
+def decode_script(text):
+    """
+    This function decodes the JSON payload of a script, either a pure JSON script or an assignment of an object
+    literal (window.__DATA__ = {...};).
+    :return: the decoded payload or None if the script holds no JSON.
+    """
+    text = text.strip()
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1 or end < start:
+        return None
+    try:
+        return json.loads(text[start:end + 1])
+    except ValueError:
+        return None
+
+
+def parse_embedded_salaries(soup):
+    """
+    This function reads the salaries out of the data the page embeds in its scripts.
+    :return: a dictionary of SALARY_KEYS names to the values found.
+    """
+    keys = set(SALARY_KEYS.values())
+    found = {}
+    for script in soup.find_all('script'):
+        if not script.string:
+            continue
+        payload = decode_script(script.string)
+        if payload is not None:
+            find_keys(payload, keys, found)
+        # Scripts that aren't valid JSON may still hold the values as "key": value pairs.
+        for key in keys - set(found):
+            match = re.search(r'"{}"\s*:\s*"?([\d,.]+)'.format(key), script.string)
+            if match:
+                found[key] = match.group(1)
+        if len(found) == len(keys):
+            break
+    return found
+
+
+def parse_salaries_html(html):
+    """
+    This function takes the html of the salaries page of a job in a city, and returns the job salaries in that city
+    (90%, median, 10%) and the median salary for the job national.
+    The data embedded in the page scripts is used first, then the rendered salary spans.
+    Raises SalaryDataNotFound if the page has neither (the page needs to be rendered by a browser).
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    found = parse_embedded_salaries(soup)
+    for key in set(SALARY_KEYS.values()) - set(found):
+        span = soup.find('span', {'class': key})
+        if span is not None and span.text.strip():
+            found[key] = span.text
+    try:
+        return tuple(to_salary(found[SALARY_KEYS[name]]) for name in ('prc90', 'med', 'prc10', 'national'))
+    except (KeyError, ValueError):
+        raise SalaryDataNotFound("missing salaries data, found only {}".format(sorted(found)))
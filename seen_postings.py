@@ -0,0 +1,90 @@
+import hashlib
+import logging
+import os
+import threading
+from bloom_filter import BloomFilter
+
+logger = logging.getLogger('info_logger')
+error_logger = logging.getLogger('error_logger')
+
+
+def fingerprint(job):
+    """
+    This function returns the fingerprint of a JobPosting: a hash of its company, title, location and date, compared
+    without case and surrounding white space so both sources give the same fingerprint for the same posting.
+    """
+    text = "\x1f".join(" ".join(str(field).lower().split())
+                       for field in (job.company, job.title, job.location, job.date_posted))
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
+class SeenPostings:
+    """
+    The fingerprints of the postings already loaded into the database, kept in a BloomFilter persisted between runs,
+    so incremental runs skip them before they reach the database, and the Adzuna search stops paging once a page holds
+    only them.
+    Postings are only remembered once they were committed (see track and commit), a failed load is retried by the
+    next run. Searches can run in several threads, each tracking its own pending list. A false positive of the filter
+    (about error_rate) skips a new posting.
+    """
+
+    def __init__(self, path, capacity=1000000, error_rate=0.001, save=True):
+        """
+        :param save: whether commit saves the filter, otherwise the committed fingerprints are kept for take_unsaved
+        (worker processes hand them to the parent process, which saves the filter).
+        """
+        self.path = path
+        self.save = save
+        self.unsaved = []
+        self._lock = threading.Lock()
+        self.filter = None
+        if os.path.exists(path):
+            try:
+                self.filter = BloomFilter.load(path, capacity)
+            except (OSError, ValueError) as error:
+                error_logger.error("Ignoring the seen postings file: {}".format(error))
+        if self.filter is None:
+            self.filter = BloomFilter(capacity, error_rate)
+        if len(self.filter) > self.filter.capacity:
+            logger.info("the seen postings filter holds {} postings, more than its capacity of {}, its false "
+                        "positive rate is above the configured one".format(len(self.filter), self.filter.capacity))
+
+    def is_known(self, job):
+        return fingerprint(job) in self.filter
+
+    def new_jobs(self, jobs):
+        """
+        This function returns the jobs of a page that were not seen yet.
+        """
+        return [job for job in jobs if not self.is_known(job)]
+
+    def track(self, jobs, pending):
+        """
+        This function passes the jobs through and appends their fingerprints to pending, a list per search that is
+        given to commit once the jobs are in the database.
+        """
+        for job in jobs:
+            pending.append(fingerprint(job))
+            yield job
+
+    def commit(self, pending):
+        """
+        This function remembers the tracked postings of a search, to call once they are in the database, and saves
+        the filter.
+        """
+        for item in pending:
+            self.filter.add(item)
+        with self._lock:
+            if not self.save:
+                self.unsaved.extend(pending)
+                return
+            self.filter.save(self.path)
+        logger.info("remembered {} new postings, {} seen in total".format(len(pending), len(self.filter)))
+
+    def take_unsaved(self):
+        """
+        This function returns the fingerprints committed since the last call, when the filter isn't saved.
+        """
+        with self._lock:
+            unsaved, self.unsaved = self.unsaved, []
+        return unsaved
@@ -0,0 +1,17 @@
+import pytest
+from bench_parsers import synthetic_page
+from job_parsers import PARSERS
+
+
+@pytest.mark.parametrize('parser_name', sorted(PARSERS))
+def test_parsers_agree_with_html_parser(parser_name):
+    html = synthetic_page(60)
+    jobs = PARSERS[parser_name](html)
+    assert len(jobs) == 60
+    assert jobs == PARSERS['html.parser'](html)
+
+
+@pytest.mark.parametrize('parser_name', sorted(PARSERS))
+@pytest.mark.parametrize('html', ["", " \n\t", "<html><body></body></html>"])
+def test_pages_without_cards_give_no_jobs(parser_name, html):
+    assert PARSERS[parser_name](html) == []
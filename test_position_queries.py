@@ -0,0 +1,143 @@
+import random
+import pytest
+from mysql.connector import Error
+import db_pool
+from migrations import migrate
+from position_queries import HOT_QUERIES, check_query_plans, explain, plan_problems
+
+DATE_INDEX = 'idx_open_positions_date'
+
+
+def step(**fields):
+    """
+    This function returns one row of a MySQL 8 EXPLAIN of open_positions, with fields replacing the defaults.
+    """
+    row = {'id': 1, 'select_type': 'PRIMARY', 'table': 'open_positions', 'partitions': None, 'type': 'range',
+           'possible_keys': DATE_INDEX, 'key': DATE_INDEX, 'key_len': '6', 'ref': None, 'rows': 120,
+           'filtered': 100.0, 'Extra': 'Using where; Backward index scan; Using index'}
+    row.update(fields)
+    return row
+
+
+def test_covering_range_scan_is_fine():
+    assert plan_problems([step()], DATE_INDEX) == []
+
+
+def test_subqueries_on_other_tables_are_ignored():
+    plan = [step(key='idx_open_positions_title_location_date', Extra='Using where; Using index'),
+            step(id=3, select_type='SUBQUERY', table='location', type='const', key='location_name', Extra=None),
+            step(id=2, select_type='SUBQUERY', table='titles', type='const', key='title', Extra='Using index')]
+    assert plan_problems(plan, 'idx_open_positions_title_location_date') == []
+
+
+def test_full_table_scan():
+    problems = plan_problems([step(type='ALL', possible_keys=None, key=None, key_len=None,
+                                   Extra='Using where; Using filesort')], DATE_INDEX)
+    assert "full table scan" in problems
+    assert "sorts the rows" in problems
+
+
+def test_wrong_index():
+    assert plan_problems([step(key='title_id')], DATE_INDEX) == [
+        "uses index title_id instead of {}".format(DATE_INDEX)]
+
+
+def test_filesort():
+    assert plan_problems([step(Extra='Using where; Using index; Using filesort')], DATE_INDEX) == ["sorts the rows"]
+
+
+def test_index_not_covering():
+    assert plan_problems([step(Extra='Using index condition')], DATE_INDEX) == ["reads the table rows"]
+
+
+def test_plan_without_open_positions():
+    assert plan_problems([step(table='titles')], DATE_INDEX) == ["no open_positions access in the plan"]
+
+
+class RecordedCursor:
+    """
+    A cursor that answers every query with one recorded EXPLAIN row.
+    """
+
+    def __init__(self, row):
+        self.row = row
+        self.queries = []
+        self.description = [(name,) for name in row]
+
+    def execute(self, query, params=()):
+        self.queries.append(query)
+
+    def fetchall(self):
+        return [tuple(self.row.values())]
+
+
+def test_explain_returns_named_columns():
+    cursor = RecordedCursor(step())
+    assert explain(cursor, "SELECT 1", ()) == [step()]
+    assert cursor.queries == ["EXPLAIN SELECT 1"]
+
+
+def test_check_query_plans_flags_every_scanning_query():
+    problems = check_query_plans(RecordedCursor(step(type='ALL', key=None, Extra='Using where')))
+    assert set(problems) == set(HOT_QUERIES)
+    assert all("full table scan" in query_problems for query_problems in problems.values())
+
+
+@pytest.fixture
+def mysql_database():
+    """
+    A throwaway database with the schema of mining_database_connection.py and enough open positions for MySQL to
+    prefer the indexes, on the server of the [MYSQL] section. Skipped when no server or user is configured.
+    """
+    user = db_pool.mysql_config.get('user')
+    if not user:
+        pytest.skip("no MySQL user in the [MYSQL] section of jobs_config.ini")
+    password = db_pool.mysql_config.get('password')
+    try:
+        server = db_pool.get_connection(None, user, password)
+    except Error as error:
+        pytest.skip("no MySQL server: {}".format(error))
+    cursor = server.cursor()
+    cursor.execute("DROP DATABASE IF EXISTS mining_plan_test")
+    cursor.execute("CREATE DATABASE mining_plan_test")
+    connection = db_pool.get_connection(None, user, password, 'mining_plan_test')
+    try:
+        from mining_database_connection import create_tables
+        create_tables(connection)
+        load_sample_positions(connection)
+        yield connection
+    finally:
+        connection.close()
+        cursor.execute("DROP DATABASE IF EXISTS mining_plan_test")
+        cursor.close()
+        server.close()
+
+
+def load_sample_positions(connection, count=20000):
+    rng = random.Random(0)
+    cursor = connection.cursor()
+    cursor.executemany("INSERT INTO titles (title) VALUES (%s)", [("Title {}".format(i),) for i in range(10)]
+                       + [("Data Scientist",)])
+    cursor.executemany("INSERT INTO location (location_name, latitude, longitude) VALUES (%s, %s, %s)",
+                       [("City {}, State".format(i), 40, -70) for i in range(50)]
+                       + [("Boston, Massachusetts", 42.36, -71.06)])
+    rows = [(rng.randint(1, 11), rng.randint(1, 51), "Job {}".format(i), "Company {}".format(rng.randint(1, 500)),
+             "2020-{:02d}-{:02d}".format(rng.randint(1, 12), rng.randint(1, 28))) for i in range(count)]
+    for start in range(0, count, 1000):
+        chunk = rows[start:start + 1000]
+        cursor.execute("""INSERT INTO open_positions (title_id, location_id, job_description, company_name,
+                          date_posted) VALUES """ + ", ".join(["(%s, %s, %s, %s, %s)"] * len(chunk)),
+                       [value for row in chunk for value in row])
+    connection.commit()
+    cursor.execute("ANALYZE TABLE open_positions")
+    cursor.fetchall()
+    cursor.close()
+
+
+def test_hot_queries_use_their_indexes(mysql_database):
+    assert migrate(mysql_database) == []  # create_tables applied them all.
+    cursor = mysql_database.cursor()
+    try:
+        assert check_query_plans(cursor) == {name: [] for name in HOT_QUERIES}
+    finally:
+        cursor.close()
@@ -0,0 +1,82 @@
+import multiprocessing
+import time
+import pytest
+from mysql.connector import Error
+import db_pool
+from work_queue import WorkQueue
+
+TEST_DATABASE = 'mining_queue_test'
+
+
+def connect_to_test_database(user, password):
+    return lambda: db_pool.get_connection(None, user, password, TEST_DATABASE)
+
+
+@pytest.fixture
+def queue_credentials():
+    """
+    A throwaway database with an empty work_queue table, on the server of the [MYSQL] section. Skipped when no server
+    or user is configured.
+    """
+    user = db_pool.mysql_config.get('user')
+    if not user:
+        pytest.skip("no MySQL user in the [MYSQL] section of jobs_config.ini")
+    password = db_pool.mysql_config.get('password')
+    try:
+        server = db_pool.get_connection(None, user, password)
+    except Error as error:
+        pytest.skip("no MySQL server: {}".format(error))
+    cursor = server.cursor()
+    cursor.execute("DROP DATABASE IF EXISTS {}".format(TEST_DATABASE))
+    cursor.execute("CREATE DATABASE {}".format(TEST_DATABASE))
+    try:
+        WorkQueue(connect_to_test_database(user, password)).create_table()
+        yield user, password
+    finally:
+        cursor.execute("DROP DATABASE IF EXISTS {}".format(TEST_DATABASE))
+        cursor.close()
+        server.close()
+
+
+def drain(user, password, index):
+    """
+    This function is a worker process of the test: it claims and completes tasks until the queue is empty.
+    :return: the ids of the tasks it completed.
+    """
+    queue = WorkQueue(connect_to_test_database(user, password), worker="test-worker:{}".format(index))
+    done = []
+    while True:
+        task = queue.claim()
+        if task is None:
+            return done
+        time.sleep(0.01)  # a search, so the workers claim at the same time.
+        queue.complete(task, 1)
+        done.append(task.task_id)
+
+
+def test_workers_do_every_task_exactly_once(queue_credentials):
+    user, password = queue_credentials
+    queue = WorkQueue(connect_to_test_database(user, password), max_attempts=3)
+    searches = [("Job {}".format(i), "City {}".format(i % 7), "State") for i in range(60)]
+    queue.enqueue(searches)
+    with queue.cursor() as cursor:
+        # the tasks of a worker that died: one can be claimed again, the other one ran out of attempts.
+        cursor.execute("""UPDATE work_queue SET status = 'claimed', worker = 'dead-host:1', attempts = 1,
+                          lease_expires = NOW() - INTERVAL 1 MINUTE WHERE job_name = 'Job 0'""")
+        cursor.execute("""UPDATE work_queue SET status = 'claimed', worker = 'dead-host:1', attempts = 3,
+                          lease_expires = NOW() - INTERVAL 1 MINUTE WHERE job_name = 'Job 1'""")
+        cursor.execute("SELECT job_name, task_id FROM work_queue")
+        task_ids = dict(cursor.fetchall())
+
+    with multiprocessing.get_context('spawn').Pool(3) as pool:
+        results = pool.starmap(drain, [(user, password, index) for index in range(3)])
+
+    done = [task_id for worker_done in results for task_id in worker_done]
+    assert sorted(done) == sorted(task_id for job_name, task_id in task_ids.items() if job_name != 'Job 1')
+    with queue.cursor() as cursor:
+        cursor.execute("SELECT job_name, status, attempts, error FROM work_queue WHERE job_name IN ('Job 0', 'Job 1')")
+        expired = {job_name: (status, attempts, error) for job_name, status, attempts, error in cursor.fetchall()}
+        cursor.execute("SELECT status, COUNT(*) FROM work_queue GROUP BY status")
+        counts = dict(cursor.fetchall())
+    assert expired == {'Job 0': ('done', 2, None), 'Job 1': ('failed', 3, 'lease expired')}
+    assert counts == {'done': 59, 'failed': 1}
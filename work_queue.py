@@ -0,0 +1,199 @@
+import logging
+import os
+import socket
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
+
+logger = logging.getLogger('info_logger')
+error_logger = logging.getLogger('error_logger')
+
+create_work_queue_table = """
+CREATE TABLE IF NOT EXISTS work_queue (
+  task_id INT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+  job_name VARCHAR(40) NOT NULL,
+  city VARCHAR(50) NOT NULL,
+  state VARCHAR(30) NOT NULL,
+  status ENUM('pending', 'claimed', 'done', 'failed') NOT NULL DEFAULT 'pending',
+  attempts SMALLINT NOT NULL DEFAULT 0,
+  worker VARCHAR(100),
+  lease_expires DATETIME,
+  jobs_found INT,
+  error VARCHAR(255),
+  enqueued_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+  finished_at DATETIME,
+  UNIQUE KEY (job_name, city, state),
+  KEY (status, lease_expires)
+) ENGINE=INNODB;
+"""
+
+Task = namedtuple('Task', ['task_id', 'job_name', 'city', 'state', 'attempts'])
+
+
+def worker_name():
+    """
+    This function returns the name of this process in the queue: its host name and process id.
+    """
+    return "{}:{}".format(socket.gethostname(), os.getpid())
+
+
+class WorkQueue:
+    """
+    A queue of (job, city, state) searches in the work_queue table, that workers on several hosts drain together.
+    A worker claims a task with SELECT ... FOR UPDATE SKIP LOCKED, so concurrent workers never wait for or get the
+    same task, and holds it for a lease of lease_seconds, renewed while the search runs. The task of a worker that died
+    is claimed again once its lease expired, and failed tasks are retried up to max_attempts times. Needs MySQL 8.
+    """
+
+    def __init__(self, connect, lease_seconds=600, max_attempts=3, worker=None):
+        """
+        :param connect: a callable returning a database connection, closed after every operation.
+        :param worker: the name of this worker, its host and process id by default.
+        """
+        self.connect = connect
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.worker = worker or worker_name()
+
+    @contextmanager
+    def cursor(self):
+        connection = self.connect()
+        cursor = connection.cursor()
+        try:
+            yield cursor
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            cursor.close()
+            connection.close()
+
+    def create_table(self):
+        with self.cursor() as cursor:
+            cursor.execute(create_work_queue_table)
+
+    def enqueue(self, searches, chunk_size=500):
+        """
+        This function adds searches to the queue, chunk_size rows per statement. A search that is already pending or
+        claimed stays as it is, a done or failed one is pending again.
+        :return: the number of searches given.
+        """
+        searches = list(searches)
+        with self.cursor() as cursor:
+            for start in range(0, len(searches), chunk_size):
+                chunk = searches[start:start + chunk_size]
+                cursor.execute("""INSERT INTO work_queue (job_name, city, state) VALUES """ +
+                               ", ".join(["(%s, %s, %s)"] * len(chunk)) + """
+                                  ON DUPLICATE KEY UPDATE
+                                  attempts = IF(status IN ('done', 'failed'), 0, attempts),
+                                  error = IF(status IN ('done', 'failed'), NULL, error),
+                                  status = IF(status IN ('done', 'failed'), 'pending', status)""",
+                               [value for search in chunk for value in search])
+        logger.info("enqueued {} searches".format(len(searches)))
+        return len(searches)
+
+    def expire_leases(self):
+        """
+        This function marks failed the claimed tasks whose lease expired and that ran out of attempts. It runs in its
+        own transaction and skips the rows other workers hold, so it never waits for them.
+        :return: the number of tasks marked failed.
+        """
+        with self.cursor() as cursor:
+            cursor.execute("""SELECT task_id FROM work_queue
+                              WHERE status = 'claimed' AND lease_expires < NOW() AND attempts >= %s
+                              FOR UPDATE SKIP LOCKED""", (self.max_attempts,))
+            task_ids = [row[0] for row in cursor.fetchall()]
+            if task_ids:
+                cursor.execute("""UPDATE work_queue SET status = 'failed', error = 'lease expired', lease_expires = NULL
+                                  WHERE task_id IN ({})""".format(", ".join(["%s"] * len(task_ids))), task_ids)
+        if task_ids:
+            logger.info("{} tasks failed after their last lease expired".format(len(task_ids)))
+        return len(task_ids)
+
+    def claim(self):
+        """
+        This function claims the oldest pending task, or a claimed one whose lease expired (those that ran out of
+        attempts are marked failed first, see expire_leases).
+        :return: the Task, None when there is nothing to do.
+        """
+        self.expire_leases()
+        with self.cursor() as cursor:
+            cursor.execute("""SELECT task_id, job_name, city, state, attempts FROM work_queue
+                              WHERE (status = 'pending' OR (status = 'claimed' AND lease_expires < NOW()))
+                                AND attempts < %s
+                              ORDER BY task_id LIMIT 1
+                              FOR UPDATE SKIP LOCKED""", (self.max_attempts,))
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            cursor.execute("""UPDATE work_queue SET status = 'claimed', worker = %s, attempts = attempts + 1,
+                              lease_expires = NOW() + INTERVAL %s SECOND
+                              WHERE task_id = %s""", (self.worker, self.lease_seconds, row[0]))
+        task = Task(row[0], row[1], row[2], row[3], row[4] + 1)
+        logger.info("{} claimed task {}: {}, {}, {}".format(self.worker, *task[:4]))
+        return task
+
+    def renew(self, task):
+        """
+        This function extends the lease of a task.
+        :return: False if the task isn't this worker's anymore (its lease expired and another worker claimed it).
+        """
+        with self.cursor() as cursor:
+            cursor.execute("""UPDATE work_queue SET lease_expires = NOW() + INTERVAL %s SECOND
+                              WHERE task_id = %s AND worker = %s AND status = 'claimed'""",
+                           (self.lease_seconds, task.task_id, self.worker))
+            return cursor.rowcount == 1
+
+    @contextmanager
+    def lease(self, task):
+        """
+        This function renews the lease of a task every third of lease_seconds while the block runs.
+        """
+        stop = threading.Event()
+
+        def keep_alive():
+            while not stop.wait(self.lease_seconds / 3):
+                try:
+                    if not self.renew(task):
+                        error_logger.error("Lost the lease of task {}".format(task.task_id))
+                        return
+                except Exception as error:
+                    error_logger.error("Failed to renew the lease of task {}: {}".format(task.task_id, error))
+
+        renewer = threading.Thread(target=keep_alive, daemon=True)
+        renewer.start()
+        try:
+            yield task
+        finally:
+            stop.set()
+            renewer.join()
+
+    def complete(self, task, jobs_found):
+        """
+        This function marks a task done.
+        """
+        with self.cursor() as cursor:
+            cursor.execute("""UPDATE work_queue SET status = 'done', jobs_found = %s, error = NULL,
+                              lease_expires = NULL, finished_at = NOW()
+                              WHERE task_id = %s AND worker = %s""", (jobs_found, task.task_id, self.worker))
+            if cursor.rowcount != 1:
+                error_logger.error("Task {} was claimed by another worker before it was done".format(task.task_id))
+
+    def fail(self, task, error, retry=True):
+        """
+        This function gives a failed task back to the queue, or marks it failed when it can't be retried.
+        """
+        with self.cursor() as cursor:
+            cursor.execute("""UPDATE work_queue SET status = IF(%s AND attempts < %s, 'pending', 'failed'),
+                              error = %s, lease_expires = NULL, finished_at = NOW()
+                              WHERE task_id = %s AND worker = %s""",
+                           (retry, self.max_attempts, str(error)[:255], task.task_id, self.worker))
+
+    def counts(self):
+        """
+        This function returns the number of tasks of every status.
+        """
+        with self.cursor() as cursor:
+            cursor.execute("""SELECT status, COUNT(*) FROM work_queue GROUP BY status""")
+            return dict(cursor.fetchall())